@@ -3,12 +3,13 @@ FastAPI main application
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
 import sys
 
 from API.core.config import settings
 from API.routes import audit, pagespeed
+from robots_sitemap import close_session
 
 # Configure logging
 logging.basicConfig(
@@ -21,13 +22,22 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Serialize responses with orjson when it is installed; audit responses carry
+# thousands of small issue dicts, which the stdlib encoder is slow on
+try:
+    import orjson  # noqa: F401
+    default_response_class = ORJSONResponse
+except ImportError:
+    default_response_class = JSONResponse
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="A comprehensive SEO Audit API that performs automated crawling, rule-based validation, and structured reporting.",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=default_response_class
 )
 
 # Configure CORS
@@ -59,6 +69,12 @@ async def root():
     }
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared HTTP session used for robots.txt and sitemap fetches"""
+    await close_session()
+
+
 @app.get("/health", tags=["health"])
 async def health_check():
     """Health check endpoint"""
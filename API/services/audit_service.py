@@ -4,7 +4,6 @@ Audit service that wraps the existing SEO audit logic
 import sys
 import os
 import logging
-import aiohttp
 from typing import Dict, Set, Optional
 from datetime import datetime
 import time
@@ -18,7 +17,7 @@ from crawler import Crawler
 from technical_audit import TechnicalAuditor
 from onpage_audit import OnPageAuditor
 from rule_engine import RuleEngine
-from robots_sitemap import SitemapParser
+from robots_sitemap import SitemapParser, get_session
 from API.services.output_generator import APIOutputGenerator
 
 # Import API modules
@@ -120,10 +119,7 @@ class AuditService:
                 
                 # Extract sitemap URLs from robots.txt - EXACTLY as in main.py
                 logger.info("🔍 Extracting sitemap URLs from robots.txt...")
-                if crawler.robots_checker.gemini_enabled:
-                    sitemap_urls_from_robots = await crawler.robots_checker.get_sitemap_urls_with_gemini()
-                else:
-                    sitemap_urls_from_robots = crawler.robots_checker.get_sitemap_urls()
+                sitemap_urls_from_robots = await crawler.robots_checker.find_sitemap_urls()
                 
                 logger.info(f"📋 Found {len(sitemap_urls_from_robots)} sitemap URL(s) from robots.txt: {sitemap_urls_from_robots}")
                 crawlability_info['sitemap_urls_from_robots'] = sitemap_urls_from_robots
@@ -131,22 +127,22 @@ class AuditService:
                 # Check for sitemap and get URLs from sitemap files - EXACTLY as in main.py
                 logger.info("🔍 Checking sitemap files and common locations...")
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        sitemap_parser = SitemapParser(base_url)
-                        sitemap_result = await sitemap_parser.get_all_sitemap_urls(session, crawler.robots_checker)
-                        sitemap_urls = sitemap_result['urls']  # URLs extracted from sitemaps
-                        all_sitemap_urls = sitemap_result['all_sitemap_urls']  # All discovered sitemap URLs
-                        accessed_sitemap_urls = sitemap_result['accessed_sitemap_urls']  # All accessed sitemap URLs
-                        total_links_count = sitemap_result['total_links_count']  # Total number of links
+                    session = await get_session()
+                    sitemap_parser = SitemapParser(base_url)
+                    sitemap_result = await sitemap_parser.get_all_sitemap_urls(session, crawler.robots_checker)
+                    sitemap_urls = sitemap_result['urls']  # URLs extracted from sitemaps
+                    all_sitemap_urls = sitemap_result['all_sitemap_urls']  # All discovered sitemap URLs
+                    accessed_sitemap_urls = sitemap_result['accessed_sitemap_urls']  # All accessed sitemap URLs
+                    total_links_count = sitemap_result['total_links_count']  # Total number of links
                         
-                        logger.info(f"📊 Extracted {total_links_count} URLs from {len(accessed_sitemap_urls)} accessible sitemap file(s) out of {len(all_sitemap_urls)} found")
-                        crawlability_info['sitemap_exists'] = len(sitemap_urls) > 0 or len(sitemap_urls_from_robots) > 0
-                        crawlability_info['sitemap_urls'] = list(sitemap_urls)[:10]  # Limit to first 10 (URLs from within sitemaps)
-                        crawlability_info['sitemap_urls_full'] = sitemap_urls  # Store full set for orphan detection
-                        crawlability_info['all_sitemap_urls'] = all_sitemap_urls  # All discovered sitemap URLs (whether accessible or not)
-                        crawlability_info['accessed_sitemap_urls'] = accessed_sitemap_urls  # All accessed sitemap URLs
-                        crawlability_info['total_sitemap_links_count'] = total_links_count  # Total links from all sitemaps
-                        logger.info(f"✅ Sitemap detection complete: exists={crawlability_info['sitemap_exists']}, from_robots={len(sitemap_urls_from_robots)}, all_found={len(all_sitemap_urls)}, accessed={len(accessed_sitemap_urls)}, total_links={total_links_count}")
+                    logger.info(f"📊 Extracted {total_links_count} URLs from {len(accessed_sitemap_urls)} accessible sitemap file(s) out of {len(all_sitemap_urls)} found")
+                    crawlability_info['sitemap_exists'] = len(sitemap_urls) > 0 or len(sitemap_urls_from_robots) > 0
+                    crawlability_info['sitemap_urls'] = list(sitemap_urls)[:10]  # Limit to first 10 (URLs from within sitemaps)
+                    crawlability_info['sitemap_urls_full'] = sitemap_urls  # Store full set for orphan detection
+                    crawlability_info['all_sitemap_urls'] = all_sitemap_urls  # All discovered sitemap URLs (whether accessible or not)
+                    crawlability_info['accessed_sitemap_urls'] = accessed_sitemap_urls  # All accessed sitemap URLs
+                    crawlability_info['total_sitemap_links_count'] = total_links_count  # Total links from all sitemaps
+                    logger.info(f"✅ Sitemap detection complete: exists={crawlability_info['sitemap_exists']}, from_robots={len(sitemap_urls_from_robots)}, all_found={len(all_sitemap_urls)}, accessed={len(accessed_sitemap_urls)}, total_links={total_links_count}")
                 except Exception as e:
                     logger.warning(f"⚠️ Could not check sitemap: {str(e)}", exc_info=True)
                     crawlability_info['sitemap_exists'] = len(sitemap_urls_from_robots) > 0
@@ -209,12 +205,13 @@ class AuditService:
             orphan_pages = onpage_auditor.find_orphan_pages(crawled_urls, sitemap_urls=sitemap_urls, base_url=base_url)
             logger.info(f"🔍 Found {len(orphan_pages)} orphan page(s)")
             
+            # Use issue-specific weight for orphan pages
+            orphan_weight = rule_engine.ISSUE_WEIGHTS.get('orphan_page', -6)
+            
             # Add duplicate/orphan info to results
             for result in all_results:
                 url = result['url']
                 if url in orphan_pages:
-                    # Use issue-specific weight for orphan pages
-                    orphan_weight = rule_engine.ISSUE_WEIGHTS.get('orphan_page', -6)
                     result['score']['issues'].append({
                         'category': 'On-Page',
                         'type': 'Internal Links',
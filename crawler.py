@@ -10,7 +10,7 @@ from urllib.parse import urljoin, urlparse
 import logging
 from datetime import datetime
 
-from utils import normalize_url, get_domain, is_internal_link
+from utils import normalize_url, normalize_urls, get_domain, is_internal_link
 from robots_sitemap import RobotsChecker
 
 logger = logging.getLogger(__name__)
@@ -149,16 +149,13 @@ class Crawler:
         links = set()
         try:
             soup = BeautifulSoup(html, 'lxml')
-            for tag in soup.find_all('a', href=True):
-                href = tag['href']
-                if href:
-                    # Resolve relative URLs
-                    absolute_url = urljoin(base_url, href)
-                    normalized = normalize_url(absolute_url)
-                    
-                    # Only include internal links
-                    if is_internal_link(normalized, self.base_domain):
-                        links.add(normalized)
+            # Resolve relative URLs
+            absolute_urls = [urljoin(base_url, tag['href']) for tag in soup.find_all('a', href=True) if tag['href']]
+            
+            for normalized in normalize_urls(absolute_urls):
+                # Only include internal links
+                if is_internal_link(normalized, self.base_domain):
+                    links.add(normalized)
         except Exception as e:
             logger.warning(f"⚠️ Error extracting links: {str(e)}")
         
@@ -4,7 +4,6 @@ Main entry point for SEO Audit System.
 import asyncio
 import logging
 import sys
-import aiohttp
 from typing import Dict, Set
 from dotenv import load_dotenv
 
@@ -13,7 +12,7 @@ from technical_audit import TechnicalAuditor
 from onpage_audit import OnPageAuditor
 from rule_engine import RuleEngine
 from output import OutputGenerator
-from robots_sitemap import SitemapParser
+from robots_sitemap import SitemapParser, get_session, close_session
 
 # Load environment variables from .env file
 load_dotenv()
@@ -77,14 +76,14 @@ async def main():
     output_generator = OutputGenerator(base_url)
     
     # Store crawlability info
-        crawlability_info = {
-            'robots_txt_exists': False,
-            'sitemap_exists': False,
-            'sitemap_urls': [],
-            'all_sitemap_urls': [],  # All discovered sitemap URLs (whether accessible or not)
-            'accessed_sitemap_urls': [],
-            'total_sitemap_links_count': 0
-        }
+    crawlability_info = {
+        'robots_txt_exists': False,
+        'sitemap_exists': False,
+        'sitemap_urls': [],
+        'all_sitemap_urls': [],  # All discovered sitemap URLs (whether accessible or not)
+        'accessed_sitemap_urls': [],
+        'total_sitemap_links_count': 0
+    }
     
     try:
         # Step 1: Crawl website
@@ -101,31 +100,28 @@ async def main():
             crawlability_info['robots_txt_exists'] = crawler.robots_checker.robots_exists
             
             # Extract sitemap URLs from robots.txt
-            if crawler.robots_checker.gemini_enabled:
-                sitemap_urls_from_robots = await crawler.robots_checker.get_sitemap_urls_with_gemini()
-            else:
-                sitemap_urls_from_robots = crawler.robots_checker.get_sitemap_urls()
+            sitemap_urls_from_robots = await crawler.robots_checker.find_sitemap_urls()
             
             crawlability_info['sitemap_urls_from_robots'] = sitemap_urls_from_robots
             
             # Check for sitemap and get URLs from sitemap files
             sitemap_urls_set = None  # Store full sitemap URLs set for orphan detection
             try:
-                async with aiohttp.ClientSession() as session:
-                    sitemap_parser = SitemapParser(base_url)
-                    sitemap_result = await sitemap_parser.get_all_sitemap_urls(session, crawler.robots_checker)
-                    sitemap_urls = sitemap_result['urls']  # URLs extracted from sitemaps
-                    sitemap_urls_set = sitemap_urls  # Store full set for orphan detection
-                    all_sitemap_urls = sitemap_result['all_sitemap_urls']  # All discovered sitemap URLs
-                    accessed_sitemap_urls = sitemap_result['accessed_sitemap_urls']  # All accessed sitemap URLs
-                    total_links_count = sitemap_result['total_links_count']  # Total number of links
+                session = await get_session()
+                sitemap_parser = SitemapParser(base_url)
+                sitemap_result = await sitemap_parser.get_all_sitemap_urls(session, crawler.robots_checker)
+                sitemap_urls = sitemap_result['urls']  # URLs extracted from sitemaps
+                sitemap_urls_set = sitemap_urls  # Store full set for orphan detection
+                all_sitemap_urls = sitemap_result['all_sitemap_urls']  # All discovered sitemap URLs
+                accessed_sitemap_urls = sitemap_result['accessed_sitemap_urls']  # All accessed sitemap URLs
+                total_links_count = sitemap_result['total_links_count']  # Total number of links
                     
-                    crawlability_info['sitemap_exists'] = len(sitemap_urls) > 0 or len(sitemap_urls_from_robots) > 0
-                    crawlability_info['sitemap_urls'] = list(sitemap_urls)[:10]  # Limit to first 10 (URLs from within sitemaps)
-                    crawlability_info['all_sitemap_urls'] = all_sitemap_urls  # All discovered sitemap URLs (whether accessible or not)
-                    crawlability_info['accessed_sitemap_urls'] = accessed_sitemap_urls  # All accessed sitemap URLs
-                    crawlability_info['total_sitemap_links_count'] = total_links_count  # Total links from all sitemaps
-                    crawlability_info['sitemap_urls_full'] = sitemap_urls_set  # Store full set for orphan detection
+                crawlability_info['sitemap_exists'] = len(sitemap_urls) > 0 or len(sitemap_urls_from_robots) > 0
+                crawlability_info['sitemap_urls'] = list(sitemap_urls)[:10]  # Limit to first 10 (URLs from within sitemaps)
+                crawlability_info['all_sitemap_urls'] = all_sitemap_urls  # All discovered sitemap URLs (whether accessible or not)
+                crawlability_info['accessed_sitemap_urls'] = accessed_sitemap_urls  # All accessed sitemap URLs
+                crawlability_info['total_sitemap_links_count'] = total_links_count  # Total links from all sitemaps
+                crawlability_info['sitemap_urls_full'] = sitemap_urls_set  # Store full set for orphan detection
             except Exception as e:
                 logger.warning(f"⚠️ Could not check sitemap: {str(e)}")
                 crawlability_info['sitemap_exists'] = len(sitemap_urls_from_robots) > 0
@@ -187,12 +183,13 @@ async def main():
         orphan_pages = onpage_auditor.find_orphan_pages(crawled_urls, sitemap_urls=sitemap_urls, base_url=base_url)
         logger.info(f"🔍 Found {len(orphan_pages)} orphan page(s)")
         
+        # Use issue-specific weight for orphan pages
+        orphan_weight = rule_engine.ISSUE_WEIGHTS.get('orphan_page', -6)
+        
         # Add duplicate/orphan info to results
         for result in all_results:
             url = result['url']
             if url in orphan_pages:
-                # Use issue-specific weight for orphan pages
-                orphan_weight = rule_engine.ISSUE_WEIGHTS.get('orphan_page', -6)
                 result['score']['issues'].append({
                     'category': 'On-Page',
                     'type': 'Internal Links',
@@ -228,6 +225,8 @@ async def main():
         logger.warning("\n\n⚠️ Operation cancelled by user")
     except Exception as e:
         logger.error(f"\n❌ Error during audit: {str(e)}", exc_info=True)
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
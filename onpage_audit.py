@@ -2,7 +2,8 @@
 On-page SEO audit module: title, meta description, H1, alt text, internal linking.
 """
 from bs4 import BeautifulSoup
-from typing import Dict, List, Set, Optional
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Optional, Tuple
 import logging
 from rapidfuzz import fuzz
 import networkx as nx
@@ -11,6 +12,24 @@ import re
 logger = logging.getLogger(__name__)
 
 
+def _group_duplicates(pairs: Iterable[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """
+    Group URLs by a field value in a single pass and keep values shared by more than one URL.
+    
+    Args:
+        pairs: Iterable of (url, value) pairs
+        
+    Returns:
+        Dict mapping value to list of URLs with that value
+    """
+    value_to_urls = defaultdict(list)
+    for url, value in pairs:
+        if value:
+            value_to_urls[value].append(url)
+    
+    return {value: urls for value, urls in value_to_urls.items() if len(urls) > 1}
+
+
 class OnPageAuditor:
     """Perform on-page SEO audits on crawled pages."""
     
@@ -84,20 +103,7 @@ class OnPageAuditor:
         Returns:
             Dict mapping title text to list of URLs with that title
         """
-        duplicates = {}
-        title_to_urls = {}
-        
-        for url, title in self.all_titles.items():
-            if title:
-                if title not in title_to_urls:
-                    title_to_urls[title] = []
-                title_to_urls[title].append(url)
-        
-        for title, urls in title_to_urls.items():
-            if len(urls) > 1:
-                duplicates[title] = urls
-        
-        return duplicates
+        return _group_duplicates(self.all_titles.items())
     
     def audit_meta_description(self, html: str, url: str) -> Dict:
         """
@@ -157,20 +163,7 @@ class OnPageAuditor:
         Returns:
             Dict mapping description text to list of URLs with that description
         """
-        duplicates = {}
-        desc_to_urls = {}
-        
-        for url, desc in self.all_descriptions.items():
-            if desc:
-                if desc not in desc_to_urls:
-                    desc_to_urls[desc] = []
-                desc_to_urls[desc].append(url)
-        
-        for desc, urls in desc_to_urls.items():
-            if len(urls) > 1:
-                duplicates[desc] = urls
-        
-        return duplicates
+        return _group_duplicates(self.all_descriptions.items())
     
     def audit_h1(self, html: str, url: str) -> Dict:
         """
@@ -232,21 +225,9 @@ class OnPageAuditor:
         Returns:
             Dict mapping H1 text to list of URLs with that H1
         """
-        duplicates = {}
-        h1_to_urls = {}
-        
-        for url, h1_list in self.all_h1s.items():
-            for h1_text in h1_list:
-                if h1_text:
-                    if h1_text not in h1_to_urls:
-                        h1_to_urls[h1_text] = []
-                    h1_to_urls[h1_text].append(url)
-        
-        for h1_text, urls in h1_to_urls.items():
-            if len(urls) > 1:
-                duplicates[h1_text] = urls
-        
-        return duplicates
+        return _group_duplicates(
+            (url, h1_text) for url, h1_list in self.all_h1s.items() for h1_text in h1_list
+        )
     
     def audit_image_alt(self, html: str, url: str) -> Dict:
         """
@@ -5,12 +5,22 @@ import json
 import csv
 import pandas as pd
 import re
+import heapq
+from array import array
 from typing import Dict, List, Set
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Console report separators
+SEP_EQ = "=" * 80
+SEP_DASH = "-" * 80
+SEVERITY_EMOJI = {'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🟢'}
+
+# Status codes that count as a healthy server response
+_OK_STATUS_CODES = frozenset({200, 301})
+
 
 class OutputGenerator:
     """Generate various output formats for SEO audit results."""
@@ -1126,7 +1136,55 @@ class OutputGenerator:
             'info': info_count,
             'sample_issues': issues_found[:5]  # Limit to 5 total
         }
-    
+
+    def _sum_page_counts(self, all_results: List[Dict]) -> Dict:
+        """
+        Reduce the per-page counters used by the console report in a single pass.
+
+        Args:
+            all_results: List of audit results
+
+        Returns:
+            Dict with site-wide totals
+        """
+        totals = {
+            'pages_with_meta_robots': 0,
+            'https_pages': 0,
+            'mixed_content_pages': 0,
+            'pages_with_schema': 0,
+            'total_images': 0,
+            'images_without_alt': 0,
+            'pages_with_missing_alt': 0,
+            'total_internal_links': 0,
+            'broken_internal_links': 0
+        }
+
+        for r in all_results:
+            technical = r.get('technical', {})
+            onpage = r.get('onpage', {})
+
+            if technical.get('meta_robots', {}).get('has_meta_robots', False):
+                totals['pages_with_meta_robots'] += 1
+            https = technical.get('https', {})
+            if https.get('is_https', False):
+                totals['https_pages'] += 1
+            if https.get('mixed_content_count', 0) > 0:
+                totals['mixed_content_pages'] += 1
+            if technical.get('structured_data', {}).get('has_structured_data', False):
+                totals['pages_with_schema'] += 1
+
+            image_alt = onpage.get('image_alt', {})
+            missing_alt = image_alt.get('images_without_alt', 0)
+            totals['total_images'] += image_alt.get('total_images', 0)
+            totals['images_without_alt'] += missing_alt
+            if missing_alt > 0:
+                totals['pages_with_missing_alt'] += 1
+            internal_links = onpage.get('internal_links', {})
+            totals['total_internal_links'] += internal_links.get('internal_link_count', 0)
+            totals['broken_internal_links'] += internal_links.get('broken_link_count', 0)
+
+        return totals
+
     def print_console_report(self, all_results: List[Dict], site_stats: Dict, 
                             crawlability_info: Dict, duplicate_titles: Dict,
                             duplicate_descriptions: Dict, duplicate_h1s: Dict,
@@ -1143,9 +1201,11 @@ class OutputGenerator:
             duplicate_h1s: Dict of duplicate H1s
             orphan_pages: Set of orphan page URLs
         """
-        print("\n" + "="*80)
+        page_counts = self._sum_page_counts(all_results)
+        
+        print(f"\n{SEP_EQ}")
         print("🔍 SEO AUDIT REPORT")
-        print("="*80)
+        print(SEP_EQ)
         print(f"\n📊 Site: {self.base_url}")
         print(f"📅 Timestamp: {self.timestamp}")
         print(f"📄 Pages Audited: {site_stats.get('total_pages', 0)}")
@@ -1159,13 +1219,13 @@ class OutputGenerator:
         # ========================================================================
         # TECHNICAL SEO SECTION
         # ========================================================================
-        print("\n" + "="*80)
+        print(f"\n{SEP_EQ}")
         print("🔧 TECHNICAL SEO")
-        print("="*80)
+        print(SEP_EQ)
         
         # Crawlability Checks
         print("\n📋 Crawlability Checks:")
-        print("-"*80)
+        print(SEP_DASH)
         
         # Robots.txt
         robots_status = 'good' if crawlability_info.get('robots_txt_exists', False) else 'warning'
@@ -1193,7 +1253,7 @@ class OutputGenerator:
         
         # Noindex Tags
         print("\n📋 Noindex Tags:")
-        print("-"*80)
+        print(SEP_DASH)
         noindex_agg = self._aggregate_site_status(all_results, 'technical', 'noindex')
         noindex_emoji = self._get_status_emoji(noindex_agg['status'])
         print(f"   {noindex_emoji} Status: ", end="")
@@ -1211,7 +1271,7 @@ class OutputGenerator:
         
         # Canonical Tags
         print("\n📋 Canonical Tags:")
-        print("-"*80)
+        print(SEP_DASH)
         canonical_agg = self._aggregate_site_status(all_results, 'technical', 'canonical')
         canonical_emoji = self._get_status_emoji(canonical_agg['status'])
         print(f"   {canonical_emoji} Status: ", end="")
@@ -1241,11 +1301,11 @@ class OutputGenerator:
         
         # Meta Robots
         print("\n📋 Meta Robots:")
-        print("-"*80)
+        print(SEP_DASH)
         meta_robots_agg = self._aggregate_site_status(all_results, 'technical', 'meta_robots')
         meta_robots_emoji = self._get_status_emoji(meta_robots_agg['status'])
         print(f"   {meta_robots_emoji} Status: ", end="")
-        pages_with_meta = sum(1 for r in all_results if r.get('technical', {}).get('meta_robots', {}).get('has_meta_robots', False))
+        pages_with_meta = page_counts['pages_with_meta_robots']
         print(f"ℹ️ {pages_with_meta}/{meta_robots_agg['total']} pages have meta robots tags")
         if meta_robots_agg['sample_issues']:
             for issue in meta_robots_agg['sample_issues'][:2]:
@@ -1253,22 +1313,25 @@ class OutputGenerator:
         
         # Server Responses
         print("\n📋 Server Responses:")
-        print("-"*80)
-        status_codes = {}
+        print(SEP_DASH)
+        # Status codes are small ints, so count them in a flat array indexed by code
+        status_counts = array('I', [0]) * 1000
         for result in all_results:
             code = result.get('status_code', 0)
-            status_codes[code] = status_codes.get(code, 0) + 1
+            if 0 <= code < 1000:
+                status_counts[code] += 1
+        status_codes = [(code, count) for code, count in enumerate(status_counts) if count]
         
-        response_status = 'good' if all(code in [200, 301] for code in status_codes.keys()) else 'warning'
+        response_status = 'good' if {code for code, _ in status_codes} <= _OK_STATUS_CODES else 'warning'
         response_emoji = self._get_status_emoji(response_status)
         print(f"   {response_emoji} Status Codes:")
-        for code, count in sorted(status_codes.items()):
+        for code, count in status_codes:
             code_emoji = '✅' if code == 200 else ('ℹ️' if code in [301, 302] else '❌')
             print(f"      {code_emoji} {code}: {count} page(s)")
         
         # Redirect Chains
         print("\n📋 Redirect Chains:")
-        print("-"*80)
+        print(SEP_DASH)
         redirect_agg = self._aggregate_site_status(all_results, 'technical', 'redirects')
         redirect_emoji = self._get_status_emoji(redirect_agg['status'])
         print(f"   {redirect_emoji} Status: ", end="")
@@ -1285,12 +1348,12 @@ class OutputGenerator:
         
         # HTTPS / Mixed Content
         print("\n📋 HTTPS / Mixed Content:")
-        print("-"*80)
+        print(SEP_DASH)
         https_agg = self._aggregate_site_status(all_results, 'technical', 'https')
         https_emoji = self._get_status_emoji(https_agg['status'])
         print(f"   {https_emoji} Status: ", end="")
-        https_pages = sum(1 for r in all_results if r.get('technical', {}).get('https', {}).get('is_https', False))
-        mixed_content_pages = sum(1 for r in all_results if r.get('technical', {}).get('https', {}).get('mixed_content_count', 0) > 0)
+        https_pages = page_counts['https_pages']
+        mixed_content_pages = page_counts['mixed_content_pages']
         print(f"✅ {https_pages}/{https_agg['total']} pages served over HTTPS")
         if mixed_content_pages > 0:
             print(f"   ⚠️ {mixed_content_pages} page(s) have mixed content (HTTP resources on HTTPS pages)")
@@ -1300,11 +1363,11 @@ class OutputGenerator:
         
         # Schema Errors
         print("\n📋 Structured Data (Schema):")
-        print("-"*80)
+        print(SEP_DASH)
         schema_agg = self._aggregate_site_status(all_results, 'technical', 'structured_data')
         schema_emoji = self._get_status_emoji(schema_agg['status'])
         print(f"   {schema_emoji} Status: ", end="")
-        pages_with_schema = sum(1 for r in all_results if r.get('technical', {}).get('structured_data', {}).get('has_structured_data', False))
+        pages_with_schema = page_counts['pages_with_schema']
         print(f"ℹ️ {pages_with_schema}/{schema_agg['total']} pages have structured data")
         if schema_agg['error'] > 0 or schema_agg['warning'] > 0:
             print(f"   ⚠️ {schema_agg['error'] + schema_agg['warning']} page(s) have schema errors")
@@ -1321,13 +1384,13 @@ class OutputGenerator:
         # ========================================================================
         # ON-PAGE SEO SECTION
         # ========================================================================
-        print("\n" + "="*80)
+        print(f"\n{SEP_EQ}")
         print("📝 ON-PAGE SEO")
-        print("="*80)
+        print(SEP_EQ)
         
         # Title Tags
         print("\n📋 Title Tags:")
-        print("-"*80)
+        print(SEP_DASH)
         title_agg = self._aggregate_site_status(all_results, 'onpage', 'title')
         title_emoji = self._get_status_emoji(title_agg['status'])
         print(f"   {title_emoji} Status: ", end="")
@@ -1346,7 +1409,7 @@ class OutputGenerator:
         # Check for duplicates
         if duplicate_titles:
             print(f"   ⚠️ {len(duplicate_titles)} duplicate title(s) found across pages")
-            for title, urls in list(duplicate_titles.items())[:3]:
+            for title, urls in heapq.nlargest(3, duplicate_titles.items(), key=lambda kv: len(kv[1])):
                 print(f"      • '{title[:50]}...' appears on {len(urls)} pages:")
                 for url in urls[:5]:
                     print(f"        - {url}")
@@ -1355,7 +1418,7 @@ class OutputGenerator:
         
         # Meta Descriptions
         print("\n📋 Meta Descriptions:")
-        print("-"*80)
+        print(SEP_DASH)
         meta_agg = self._aggregate_site_status(all_results, 'onpage', 'meta_description')
         meta_emoji = self._get_status_emoji(meta_agg['status'])
         print(f"   {meta_emoji} Status: ", end="")
@@ -1380,7 +1443,7 @@ class OutputGenerator:
         # Check for duplicates
         if duplicate_descriptions:
             print(f"   ⚠️ {len(duplicate_descriptions)} duplicate description(s) found")
-            for desc, urls in list(duplicate_descriptions.items())[:2]:
+            for desc, urls in heapq.nlargest(2, duplicate_descriptions.items(), key=lambda kv: len(kv[1])):
                 print(f"      • Description appears on {len(urls)} pages:")
                 for url in urls[:5]:
                     print(f"        - {url}")
@@ -1389,7 +1452,7 @@ class OutputGenerator:
         
         # H1 Tags
         print("\n📋 H1 Tags:")
-        print("-"*80)
+        print(SEP_DASH)
         h1_agg = self._aggregate_site_status(all_results, 'onpage', 'h1')
         h1_emoji = self._get_status_emoji(h1_agg['status'])
         print(f"   {h1_emoji} Status: ", end="")
@@ -1418,7 +1481,7 @@ class OutputGenerator:
         # Check for duplicates
         if duplicate_h1s:
             print(f"   ⚠️ {len(duplicate_h1s)} duplicate H1(s) found across pages")
-            for h1_text, urls in list(duplicate_h1s.items())[:2]:
+            for h1_text, urls in heapq.nlargest(2, duplicate_h1s.items(), key=lambda kv: len(kv[1])):
                 print(f"      • '{h1_text[:50]}...' appears on {len(urls)} pages:")
                 for url in urls[:5]:
                     print(f"        - {url}")
@@ -1427,27 +1490,27 @@ class OutputGenerator:
         
         # Image Alt Text
         print("\n📋 Image Alt Text:")
-        print("-"*80)
+        print(SEP_DASH)
         alt_agg = self._aggregate_site_status(all_results, 'onpage', 'image_alt')
         alt_emoji = self._get_status_emoji(alt_agg['status'])
         print(f"   {alt_emoji} Status: ", end="")
-        total_images = sum(r.get('onpage', {}).get('image_alt', {}).get('total_images', 0) for r in all_results)
-        images_without_alt = sum(r.get('onpage', {}).get('image_alt', {}).get('images_without_alt', 0) for r in all_results)
+        total_images = page_counts['total_images']
+        images_without_alt = page_counts['images_without_alt']
         if images_without_alt > 0:
             print(f"⚠️ {images_without_alt} image(s) missing alt text (out of {total_images} total)")
-            pages_with_issues = sum(1 for r in all_results if r.get('onpage', {}).get('image_alt', {}).get('images_without_alt', 0) > 0)
+            pages_with_issues = page_counts['pages_with_missing_alt']
             print(f"   Found on {pages_with_issues} page(s)")
         else:
             print(f"✅ All images have alt text ({total_images} images checked)")
         
         # Internal Linking
         print("\n📋 Internal Linking:")
-        print("-"*80)
+        print(SEP_DASH)
         links_agg = self._aggregate_site_status(all_results, 'onpage', 'internal_links')
         links_emoji = self._get_status_emoji(links_agg['status'])
         print(f"   {links_emoji} Status: ", end="")
-        total_links = sum(r.get('onpage', {}).get('internal_links', {}).get('internal_link_count', 0) for r in all_results)
-        broken_links = sum(r.get('onpage', {}).get('internal_links', {}).get('broken_link_count', 0) for r in all_results)
+        total_links = page_counts['total_internal_links']
+        broken_links = page_counts['broken_internal_links']
         print(f"ℹ️ {total_links} total internal links found")
         if broken_links > 0:
             print(f"   ⚠️ {broken_links} potentially broken internal link(s)")
@@ -1462,15 +1525,15 @@ class OutputGenerator:
         # ========================================================================
         # SUMMARY
         # ========================================================================
-        print("\n" + "="*80)
+        print(f"\n{SEP_EQ}")
         print("📊 SUMMARY")
-        print("="*80)
+        print(SEP_EQ)
         
         # Top pages with issues
         sorted_results = sorted(all_results, key=lambda x: x.get('score', {}).get('score', 100))
         
         print(f"\n🔴 Top 5 Pages with Most Issues:")
-        print("-"*80)
+        print(SEP_DASH)
         for i, result in enumerate(sorted_results[:5], 1):
             url = result.get('url', '')
             score = result.get('score', {}).get('score', 0)
@@ -1482,15 +1545,15 @@ class OutputGenerator:
             # Show top 2 issues
             issues = result.get('score', {}).get('issues', [])[:2]
             for issue in issues:
-                severity_emoji = {'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🟢'}.get(issue['severity'], '⚪')
+                severity_emoji = SEVERITY_EMOJI.get(issue['severity'], '⚪')
                 print(f"   {severity_emoji} {issue['message']}")
         
         # ========================================================================
         # DETAILED ISSUES WITH URLs
         # ========================================================================
-        print("\n" + "="*80)
+        print(f"\n{SEP_EQ}")
         print("📋 DETAILED ISSUES BY CATEGORY (WITH URLs)")
-        print("="*80)
+        print(SEP_EQ)
         
         # Group issues by type and collect URLs
         issues_by_type = {}
@@ -1518,7 +1581,7 @@ class OutputGenerator:
         
         for issue_key, issue_data in sorted_issues[:20]:  # Show top 20 issue types
             severity = issue_data['severity']
-            severity_emoji = {'critical': '🔴', 'high': '🟠', 'medium': '🟡', 'low': '🟢'}.get(severity, '⚪')
+            severity_emoji = SEVERITY_EMOJI.get(severity, '⚪')
             url_count = len(issue_data['urls'])
             
             print(f"\n{severity_emoji} {issue_data['category']} > {issue_data['type']}")
@@ -1530,6 +1593,6 @@ class OutputGenerator:
             if url_count > 10:
                 print(f"      ... and {url_count - 10} more page(s)")
         
-        print("\n" + "="*80)
+        print(f"\n{SEP_EQ}")
         print("✅ Audit Complete!")
-        print("="*80 + "\n")
+        print(f"{SEP_EQ}\n")
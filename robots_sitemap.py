@@ -3,16 +3,53 @@ Robots.txt and Sitemap handling module.
 """
 import asyncio
 import aiohttp
+import functools
 import os
 import re
+import time
+import zlib
+from collections import OrderedDict
 from urllib.robotparser import RobotFileParser
-from urllib.parse import urljoin, urlparse
-from xml.etree import ElementTree as ET
-from typing import List, Set, Optional, Dict
+from urllib.parse import urljoin, urlparse, unquote
+from typing import List, Set, Optional, Dict, Tuple, Pattern
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefer lxml's C-backed pull parser for sitemaps, fall back to the stdlib
+try:
+    from lxml import etree as ET
+    # Sitemaps can legitimately be tens of MB and are often slightly malformed
+    _PULL_PARSER_OPTIONS = {'huge_tree': True, 'recover': True}
+except ImportError:
+    from xml.etree import ElementTree as ET
+    _PULL_PARSER_OPTIONS = {}
+
+# orjson is optional; the stdlib json module has the same loads() interface
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Patterns for pulling sitemap URLs out of Gemini responses
+_JSON_ARRAY_RE = re.compile(r'\[.*?\]', re.DOTALL)
+_URL_RE = re.compile(r'https?://[^\s,\]]+')
+
+# Qualified (Clark notation) sitemap tags, compared directly against parsed element tags
+_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+_LOC_TAG = f'{{{_NS}}}loc'
+_URLSET_TAG = f'{{{_NS}}}urlset'
+_INDEX_TAG = f'{{{_NS}}}sitemapindex'
+
+# Entry wrapper tag -> root tag of the sitemap document it belongs to
+_ENTRY_DOC_TAGS = {
+    f'{{{_NS}}}url': _URLSET_TAG,
+    f'{{{_NS}}}sitemap': _INDEX_TAG,
+}
+
+# "Sitemap:" directives in robots.txt (value ends at whitespace or a trailing comment)
+_SITEMAP_RE = re.compile(r'^[ \t]*sitemap[ \t]*:[ \t]*([^\s#]+)', re.IGNORECASE | re.MULTILINE)
+
 # Try to import google.generativeai, but make it optional
 try:
     import google.generativeai as genai
@@ -21,60 +58,158 @@ except ImportError:
     GEMINI_AVAILABLE = False
     logger.warning("⚠️ google-generativeai not installed. Gemini integration disabled. Install with: pip install google-generativeai")
 
+GEMINI_MODEL_NAME = 'gemini-2.5-flash'
+
+
+@functools.lru_cache(maxsize=4)
+def _get_gemini_model(api_key: str, model_name: str = GEMINI_MODEL_NAME):
+    """
+    Configure Gemini and build the model once per (api_key, model_name).
+    
+    Args:
+        api_key: Gemini API key
+        model_name: Gemini model name
+        
+    Returns:
+        Cached GenerativeModel instance
+    """
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
+# Shared session so robots.txt and sitemap fetches reuse keep-alive connections
+# and cached DNS lookups across audits
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared aiohttp session, creating it on first use.
+    
+    Returns:
+        Shared ClientSession with a bounded connection pool
+    """
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            )
+        )
+    return _SESSION
+
+
+async def close_session():
+    """Close the shared aiohttp session if it was created."""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
 
 class RobotsChecker:
     """Handle robots.txt parsing and validation."""
     
+    # Parsed robots.txt shared across instances, least recently used first:
+    # robots URL -> (fetched_at, content, parser, groups)
+    _ROBOTS_CACHE: OrderedDict = OrderedDict()
+    _ROBOTS_CACHE_SIZE = 256
+    _ROBOTS_TTL = 21600  # 6 hours, well inside Google's 24h robots.txt cache guideline
+    # One lock per robots URL so concurrent audits fetch once: robots URL -> [lock, active fetchers];
+    # dropped when the last fetcher is done
+    _ROBOTS_LOCKS: Dict[str, list] = {}
+    
     def __init__(self, base_url: str, gemini_api_key: Optional[str] = None):
         self.base_url = base_url
         self.robots_url = urljoin(base_url, '/robots.txt')
+        # Site origin (scheme://netloc) that relative sitemap URLs are resolved against
+        robots_parts = urlparse(self.robots_url)
+        self._origin = f"{robots_parts.scheme}://{robots_parts.netloc}"
         self.llms_url = urljoin(base_url, '/llms.txt')
         self.parser: Optional[RobotFileParser] = None
+        self._robots_groups: List[Tuple[List[str], List[str], List[str]]] = []  # (user_agents, allows, disallows)
+        self._compiled_rules: Dict[str, Tuple[List[Tuple[int, Pattern]], List[Tuple[int, Pattern]]]] = {}
         self.robots_exists = False
         self.robots_content: str = ""
         self.llms_exists = False
         self.llms_content: str = ""
         self.gemini_api_key = gemini_api_key or os.getenv('GEMINI_API_KEY')
         self.gemini_enabled = GEMINI_AVAILABLE and self.gemini_api_key is not None
+        self._gemini_model = None
         
         if self.gemini_enabled:
             try:
-                genai.configure(api_key=self.gemini_api_key)
+                self._gemini_model = _get_gemini_model(self.gemini_api_key)
             except Exception as e:
                 logger.warning(f"⚠️ Failed to configure Gemini API: {str(e)}")
                 self.gemini_enabled = False
         
-    async def fetch_robots(self, session: aiohttp.ClientSession) -> bool:
+    async def fetch_robots(self, session: Optional[aiohttp.ClientSession] = None) -> bool:
         """
         Fetch and parse robots.txt and llms.txt.
+        A successfully parsed robots.txt is reused across instances for _ROBOTS_TTL seconds.
         
         Args:
-            session: aiohttp session
+            session: aiohttp session (defaults to the shared session)
             
         Returns:
             True if robots.txt exists and is accessible
         """
+        if session is None:
+            session = await get_session()
         robots_fetched = False
         headers = {
             'User-Agent': 'SEO-Audit-Bot/1.0 (Technical SEO Audit Tool)',
             'Accept': 'text/plain, */*'
         }
+        lock_entry = self._ROBOTS_LOCKS.get(self.robots_url)
+        if lock_entry is None:
+            lock_entry = self._ROBOTS_LOCKS[self.robots_url] = [asyncio.Lock(), 0]
+        lock_entry[1] += 1
         try:
-            async with session.get(
-                self.robots_url,
-                timeout=aiohttp.ClientTimeout(total=10),
-                headers=headers
-            ) as response:
-                if response.status == 200:
-                    content = await response.text()
-                    self.robots_content = content
-                    self.parser = RobotFileParser()
-                    self.parser.set_url(self.robots_url)
-                    self.parser.read()
+            async with lock_entry[0]:
+                cached = self._ROBOTS_CACHE.get(self.robots_url)
+                if cached is not None and time.monotonic() - cached[0] < self._ROBOTS_TTL:
+                    self._ROBOTS_CACHE.move_to_end(self.robots_url)
+                    _, self.robots_content, self.parser, self._robots_groups = cached
+                    self._compiled_rules = {}
                     self.robots_exists = True
                     robots_fetched = True
-        except Exception as e:
-            logger.warning(f"⚠️ Could not fetch robots.txt: {str(e)}")
+                else:
+                    # Don't keep a stale entry alive if the refetch fails
+                    self._ROBOTS_CACHE.pop(self.robots_url, None)
+                    try:
+                        async with session.get(
+                            self.robots_url,
+                            timeout=aiohttp.ClientTimeout(total=10),
+                            headers=headers
+                        ) as response:
+                            if response.status == 200:
+                                content = await response.text()
+                                self.robots_content = content
+                                self.parser = RobotFileParser()
+                                self.parser.set_url(self.robots_url)
+                                # Parse the body we already have; read() would re-download it with
+                                # a blocking urllib request on the event loop
+                                self.parser.parse(content.splitlines())
+                                self._robots_groups = self._parse_robots_groups(content)
+                                self._compiled_rules = {}
+                                self.robots_exists = True
+                                robots_fetched = True
+                                self._ROBOTS_CACHE[self.robots_url] = (
+                                    time.monotonic(), content, self.parser, self._robots_groups
+                                )
+                                if len(self._ROBOTS_CACHE) > self._ROBOTS_CACHE_SIZE:
+                                    self._ROBOTS_CACHE.popitem(last=False)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Could not fetch robots.txt: {str(e)}")
+        finally:
+            lock_entry[1] -= 1
+            if lock_entry[1] == 0:
+                del self._ROBOTS_LOCKS[self.robots_url]
         
         # Also check for llms.txt
         try:
@@ -94,6 +229,109 @@ class RobotsChecker:
         
         return robots_fetched
     
+    @staticmethod
+    def _parse_robots_groups(content: str) -> List[Tuple[List[str], List[str], List[str]]]:
+        """
+        Split robots.txt content into user-agent groups.
+        
+        Args:
+            content: Raw robots.txt content
+            
+        Returns:
+            List of (user_agents, allow_patterns, disallow_patterns) tuples
+        """
+        groups = []
+        current = None
+        in_rules = False
+        
+        for line in content.splitlines():
+            line = line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            field, value = line.split(':', 1)
+            field = field.strip().lower()
+            value = value.strip()
+            
+            if field == 'user-agent':
+                # Consecutive user-agent lines share one group
+                if current is None or in_rules:
+                    current = ([], [], [])
+                    groups.append(current)
+                    in_rules = False
+                current[0].append(value.lower())
+            elif field in ('allow', 'disallow') and current is not None:
+                in_rules = True
+                # An empty rule matches nothing
+                if value:
+                    current[1 if field == 'allow' else 2].append(unquote(value))
+        
+        return groups
+    
+    @staticmethod
+    def _compile_patterns(patterns: List[str]) -> List[Tuple[int, Pattern]]:
+        """
+        Compile robots.txt path patterns into anchored regexes, most specific first.
+        Supports the '*' wildcard and the '$' end-of-path anchor.
+        
+        Args:
+            patterns: Allow or Disallow path patterns
+            
+        Returns:
+            List of (pattern length, compiled regex), longest pattern first
+        """
+        rules = []
+        for pattern in dict.fromkeys(patterns):
+            anchored = pattern.endswith('$')
+            body = pattern[:-1] if anchored else pattern
+            regex = '.*'.join(re.escape(part) for part in body.split('*'))
+            rules.append((len(pattern), re.compile(regex + '$' if anchored else regex)))
+        
+        rules.sort(key=lambda rule: rule[0], reverse=True)
+        return rules
+    
+    @staticmethod
+    def _longest_match(rules: List[Tuple[int, Pattern]], path: str) -> int:
+        """
+        Find the length of the most specific rule matching a path.
+        
+        Args:
+            rules: Rules from _compile_patterns (longest first)
+            path: URL path, with query if any
+            
+        Returns:
+            Length of the longest matching pattern, or -1 if none match
+        """
+        for length, regex in rules:
+            if regex.match(path):
+                return length
+        return -1
+    
+    def _get_compiled_rules(self, user_agent: str) -> Tuple[List[Tuple[int, Pattern]], List[Tuple[int, Pattern]]]:
+        """
+        Get the compiled (allow, disallow) rules for a user agent, building them once.
+        
+        Args:
+            user_agent: User agent string
+            
+        Returns:
+            Tuple of (allow rules, disallow rules)
+        """
+        rules = self._compiled_rules.get(user_agent)
+        if rules is not None:
+            return rules
+        
+        agent_token = user_agent.split('/')[0].lower()
+        matching = [g for g in self._robots_groups
+                    if any(a != '*' and a in agent_token for a in g[0])]
+        if not matching:
+            matching = [g for g in self._robots_groups if '*' in g[0]]
+        
+        allows = [p for g in matching for p in g[1]]
+        disallows = [p for g in matching for p in g[2]]
+        rules = (self._compile_patterns(allows), self._compile_patterns(disallows))
+        self._compiled_rules[user_agent] = rules
+        return rules
+    
     def can_fetch(self, url: str, user_agent: str = '*') -> bool:
         """
         Check if a URL can be fetched according to robots.txt.
@@ -109,7 +347,20 @@ class RobotsChecker:
             return True  # Default to allowed if no robots.txt
         
         try:
-            return self.parser.can_fetch(user_agent, url)
+            allow_rules, disallow_rules = self._get_compiled_rules(user_agent)
+            if not disallow_rules:
+                return True
+            
+            parsed = urlparse(url)
+            path = unquote(parsed.path) or '/'
+            if parsed.query:
+                path = f"{path}?{unquote(parsed.query)}"
+            
+            # The most specific (longest) matching rule wins; Allow wins a tie (RFC 9309)
+            disallow_length = self._longest_match(disallow_rules, path)
+            if disallow_length < 0:
+                return True
+            return self._longest_match(allow_rules, path) >= disallow_length
         except Exception:
             return True
     
@@ -128,6 +379,43 @@ class RobotsChecker:
         except Exception:
             return []
     
+    def extract_sitemaps_fast(self) -> List[str]:
+        """
+        Extract sitemap URLs from the fetched robots.txt with a single regex pass.
+        
+        Returns:
+            List of sitemap URLs (relative ones resolved against the site origin)
+        """
+        sitemaps = []
+        for url in _SITEMAP_RE.findall(self.robots_content):
+            if not (url[:8] == 'https://' or url[:7] == 'http://'):
+                url = self._origin + '/' + url.lstrip('/')
+            sitemaps.append(url)
+        return sitemaps
+    
+    async def find_sitemap_urls(self) -> List[str]:
+        """
+        Extract sitemap URLs from robots.txt, using Gemini only when the fast extraction looks unreliable.
+        The fast extraction is trusted when it finds sitemaps and finds one per "Sitemap:" line.
+        
+        Returns:
+            List of sitemap URLs
+        """
+        sitemaps = self.extract_sitemaps_fast()
+        if not self.gemini_enabled:
+            return sitemaps
+        
+        if sitemaps:
+            directive_count = sum(
+                1 for line in self.robots_content.splitlines()
+                if line.strip().lower().startswith('sitemap:')
+            )
+            if directive_count == len(sitemaps):
+                logger.info(f"✅ robots.txt is well-formed, skipping Gemini ({len(sitemaps)} sitemap URL(s))")
+                return sitemaps
+        
+        return await self.get_sitemap_urls_with_gemini()
+    
     async def get_sitemap_urls_with_gemini(self) -> List[str]:
         """
         Extract sitemap URLs from robots.txt using Gemini 2.5 Flash model.
@@ -166,27 +454,26 @@ Example output format:
 
 Output:"""
             
-            # Use Gemini 2.5 Flash model strictly
-            model = genai.GenerativeModel('gemini-2.5-flash')
-            response = model.generate_content(prompt)
+            # Use Gemini 2.5 Flash model strictly. generate_content is a blocking HTTP
+            # call, so run it in a worker thread to keep the event loop serving fetches.
+            response = await asyncio.to_thread(self._gemini_model.generate_content, prompt)
             
             # Parse response
             response_text = response.text.strip()
             
             # Try to extract JSON array from response
             # Handle cases where response might have markdown formatting
-            json_match = re.search(r'\[.*?\]', response_text, re.DOTALL)
+            json_match = _JSON_ARRAY_RE.search(response_text)
             if json_match:
-                import json
                 try:
-                    sitemaps_json = json.loads(json_match.group(0))
+                    sitemaps_json = _json.loads(json_match.group(0))
                     sitemap_urls = []
                     
                     for url in sitemaps_json:
                         if isinstance(url, str):
-                            # Ensure absolute URL
-                            if not url.startswith(('http://', 'https://')):
-                                url = urljoin(self.base_url, url.lstrip('/'))
+                            # Ensure absolute URL (Sitemap: lines are almost always absolute already)
+                            if not (url[:8] == 'https://' or url[:7] == 'http://'):
+                                url = self._origin + '/' + url.lstrip('/')
                             sitemap_urls.append(url)
                     
                     logger.info(f"✅ Gemini extracted {len(sitemap_urls)} sitemap URL(s)")
@@ -194,12 +481,11 @@ Output:"""
                         for idx, url in enumerate(sitemap_urls, 1):
                             logger.info(f"   {idx}. {url}")
                     return sitemap_urls
-                except json.JSONDecodeError as e:
+                except ValueError as e:  # JSONDecodeError from either library
                     logger.warning(f"⚠️ Failed to parse Gemini JSON response: {str(e)}")
             
             # Fallback: Try to extract URLs directly from response text
-            url_pattern = r'https?://[^\s,\]]+'
-            urls = re.findall(url_pattern, response_text)
+            urls = _URL_RE.findall(response_text)
             if urls:
                 logger.info(f"✅ Gemini extracted {len(urls)} sitemap URL(s) (via regex fallback)")
                 return urls
@@ -215,17 +501,27 @@ Output:"""
 class SitemapParser:
     """Handle sitemap parsing and URL extraction."""
     
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, max_concurrency: int = 16, max_depth: int = 5,
+                 max_urls: int = 5_000_000, max_bytes: int = 52_428_800):
         self.base_url = base_url
+        self.max_depth = max_depth  # Maximum sitemap index nesting to follow
+        self.max_urls = max_urls  # Stop collecting once this many URLs are found in one crawl
+        self.max_bytes = max_bytes  # Per-sitemap (uncompressed) size cap, 50MB like Google's limit
         self.sitemap_urls: List[str] = []
         self.discovered_urls: Set[str] = set()
         self.accessed_sitemap_urls: List[str] = []  # Track all successfully accessed sitemap URLs
         self.all_found_sitemap_urls: List[str] = []  # Track all sitemap URLs found (from robots.txt + nested ones)
+        self._accessed_set: Set[str] = set()  # Membership index for accessed_sitemap_urls
+        self._all_found_set: Set[str] = set()  # Membership index for all_found_sitemap_urls
+        self.max_concurrency = max_concurrency  # Number of queue workers fetching sitemaps
+        self._semaphore = asyncio.Semaphore(max_concurrency)  # Caps concurrent sitemap fetches
+        self._sitemap_cache: Dict[str, frozenset] = {}  # sitemap URL -> URLs found, for this run
+        self._inflight_sitemaps: Dict[str, asyncio.Future] = {}  # sitemap URL -> pending fetch
         
     async def discover_sitemaps_from_robots(self, robots_checker: RobotsChecker) -> List[str]:
         """
         Discover sitemap URLs from robots.txt only.
-        Uses Gemini 2.5 Flash to extract from robots.txt if available.
+        Uses Gemini 2.5 Flash to extract from robots.txt if available and the standard parser looks unreliable.
         
         Args:
             robots_checker: RobotsChecker instance
@@ -235,89 +531,262 @@ class SitemapParser:
         """
         sitemaps = []
         
-        # Get from robots.txt using Gemini if available, otherwise use standard parser
-        if robots_checker.gemini_enabled:
-            gemini_sitemaps = await robots_checker.get_sitemap_urls_with_gemini()
-            sitemaps.extend(gemini_sitemaps)
-        else:
-            sitemaps.extend(robots_checker.get_sitemap_urls())
+        # Standard parser, falling back to Gemini (if available) for unusual robots.txt files
+        sitemaps.extend(await robots_checker.find_sitemap_urls())
         
         self.sitemap_urls = list(set(sitemaps))
         logger.info(f"📋 Found {len(self.sitemap_urls)} sitemap URL(s) from robots.txt")
         return self.sitemap_urls
     
-    async def parse_sitemap(self, session: aiohttp.ClientSession, sitemap_url: str) -> Set[str]:
+    @staticmethod
+    def _drain_sitemap_events(parser: ET.XMLPullParser, locs: List[str], doc_tag: Optional[str],
+                              entry_count: int) -> Tuple[Optional[str], int]:
+        """
+        Consume pending pull-parser end events, collecting <loc> values.
+        Every element is cleared as soon as it ends, and finished <url>/<sitemap>
+        entries are periodically detached from the root, so memory stays flat
+        regardless of sitemap size.
+        
+        Args:
+            parser: XMLPullParser fed with sitemap bytes
+            locs: List to append stripped <loc> text to
+            doc_tag: Root tag determined so far (None until the first entry ends)
+            entry_count: Number of <url>/<sitemap> entries ended so far
+            
+        Returns:
+            Tuple of (qualified root tag implied by the entries ('{ns}urlset' or
+            '{ns}sitemapindex'), updated entry count)
+        """
+        for _, elem in parser.read_events():
+            tag = elem.tag
+            if tag == _LOC_TAG:
+                if elem.text:
+                    locs.append(elem.text.strip())
+            elif tag in _ENTRY_DOC_TAGS:
+                doc_tag = _ENTRY_DOC_TAGS[tag]
+                entry_count += 1
+                # Cleared entries still leave an empty shell on the root; lxml lets us drop
+                # them in bulk (the stdlib fallback keeps the small shells). Only the finished
+                # siblings before this entry go: lxml must not lose an element still being built
+                if entry_count % 10000 == 0 and hasattr(elem, 'getprevious'):
+                    parent = elem.getparent()
+                    if parent is not None:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+            elem.clear()
+        return doc_tag, entry_count
+    
+    async def parse_sitemap(self, session: Optional[aiohttp.ClientSession], sitemap_url: str, _depth: int = 0) -> Set[str]:
         """
         Parse a sitemap XML and extract URLs.
         Tracks successfully accessed sitemap URLs and discovers nested sitemap URLs from sitemap indexes.
+        Results are memoized per sitemap URL until the next get_all_sitemap_urls run, and
+        concurrent requests for the same sitemap share a single fetch. Each call returns its
+        own set, and max_urls applies to each crawl separately.
         
         Args:
-            session: aiohttp session
+            session: aiohttp session (None uses the shared session)
             sitemap_url: URL of the sitemap
             
         Returns:
             Set of URLs found in sitemap
         """
+        cached = self._sitemap_cache.get(sitemap_url)
+        if cached is not None:
+            return set(cached)
+        
+        inflight = self._inflight_sitemaps.get(sitemap_url)
+        if inflight is not None:
+            return set(await asyncio.shield(inflight))
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_sitemaps[sitemap_url] = future
+        try:
+            if session is None:
+                session = await get_session()
+            urls = await self._crawl_sitemaps(session, [sitemap_url], _depth)
+            self._sitemap_cache[sitemap_url] = frozenset(urls)
+            future.set_result(self._sitemap_cache[sitemap_url])
+            return urls
+        finally:
+            del self._inflight_sitemaps[sitemap_url]
+            if not future.done():
+                future.cancel()
+    
+    async def _crawl_sitemaps(self, session: aiohttp.ClientSession, sitemap_urls: List[str], depth: int = 0) -> Set[str]:
+        """
+        Fetch sitemaps breadth-first from a work queue, queueing nested sitemaps of indexes as they are found.
+        
+        Args:
+            session: aiohttp session
+            sitemap_urls: Sitemap URLs to start from
+            depth: Nesting level of the starting sitemaps
+            
+        Returns:
+            Set of URLs found in the sitemaps and all nested sitemaps
+        """
+        all_urls: Set[str] = set()
+        queue: asyncio.Queue = asyncio.Queue()
+        # Sitemaps already queued by this crawl; guards against cycles between indexes
+        scheduled: Set[str] = set(sitemap_urls)
+        # URLs collected by this crawl, checked against max_urls (a list so _fetch_sitemap can update it)
+        url_count = [0]
+        for sitemap_url in dict.fromkeys(sitemap_urls):
+            queue.put_nowait((sitemap_url, depth))
+        queued = queue.qsize()
+        completed = 0
+        
+        async def worker():
+            nonlocal queued, completed
+            while True:
+                sitemap_url, level = await queue.get()
+                try:
+                    urls, nested_sitemap_urls = await self._fetch_sitemap(session, sitemap_url, level, url_count)
+                    all_urls.update(urls)
+                    # Shared dedupe set: a sitemap is queued at most once per crawl, which also breaks cycles
+                    for nested_sitemap_url in nested_sitemap_urls:
+                        if nested_sitemap_url not in scheduled:
+                            scheduled.add(nested_sitemap_url)
+                            queue.put_nowait((nested_sitemap_url, level + 1))
+                            queued += 1
+                    # Don't keep this sitemap's results alive while idling in queue.get()
+                    del urls, nested_sitemap_urls
+                except Exception as e:
+                    logger.warning(f"⚠️ Could not process sitemap {sitemap_url}: {str(e)}")
+                finally:
+                    # Report progress in completion order, as each sitemap finishes
+                    completed += 1
+                    logger.info(f"📈 Sitemap progress: {completed}/{queued} processed ({sitemap_url})")
+                    queue.task_done()
+        
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrency)]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        
+        return all_urls
+    
+    async def _fetch_sitemap(self, session: aiohttp.ClientSession, sitemap_url: str, depth: int,
+                             url_count: List[int]) -> Tuple[Set[str], List[str]]:
+        """
+        Fetch and parse a single sitemap.
+        Stops at max_depth levels of nesting, max_urls URLs per crawl and max_bytes per sitemap.
+        
+        Args:
+            session: aiohttp session
+            sitemap_url: URL of the sitemap
+            depth: Nesting level of this sitemap (0 for sitemaps listed in robots.txt)
+            url_count: Single-item list holding the URLs collected so far by this crawl (updated in place)
+            
+        Returns:
+            Tuple of (URLs found in a urlset, nested sitemap URLs found in a sitemap index)
+        """
         urls = set()
+        nested_sitemap_urls = []
+        fetched = False
+        
+        if depth >= self.max_depth:
+            logger.warning(f"⚠️ Skipping sitemap {sitemap_url}: nesting deeper than {self.max_depth} levels")
+            return urls, nested_sitemap_urls
+        if url_count[0] >= self.max_urls:
+            logger.warning(f"⚠️ Skipping sitemap {sitemap_url}: URL limit of {self.max_urls} reached")
+            return urls, nested_sitemap_urls
         
         try:
-            async with session.get(
-                sitemap_url,
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={
-                    'User-Agent': 'SEO-Audit-Bot/1.0 (Technical SEO Audit Tool)',
-                    'Accept': 'application/xml, text/xml, */*',
-                    'Accept-Language': 'en-US,en;q=0.9'
-                }
-            ) as response:
-                if response.status == 200:
-                    # Track this sitemap as successfully accessed
-                    if sitemap_url not in self.accessed_sitemap_urls:
-                        self.accessed_sitemap_urls.append(sitemap_url)
-                    
-                    # Track all found sitemap URLs
-                    if sitemap_url not in self.all_found_sitemap_urls:
-                        self.all_found_sitemap_urls.append(sitemap_url)
-                    
-                    content = await response.text()
-                    root = ET.fromstring(content)
-                    
-                    # Handle sitemap index
-                    if root.tag.endswith('sitemapindex'):
-                        sitemap_locs = root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                        nested_sitemap_urls = []
-                        for loc in sitemap_locs:
-                            if loc.text:
-                                nested_sitemap_url = loc.text.strip()
-                                nested_sitemap_urls.append(nested_sitemap_url)
-                                # Track nested sitemap URLs found
-                                if nested_sitemap_url not in self.all_found_sitemap_urls:
-                                    self.all_found_sitemap_urls.append(nested_sitemap_url)
-                                # Recursively parse nested sitemaps
-                                nested_urls = await self.parse_sitemap(session, nested_sitemap_url)
-                                urls.update(nested_urls)
+            async with self._semaphore:
+                async with session.get(
+                    sitemap_url,
+                    timeout=aiohttp.ClientTimeout(total=30),
+                    headers={
+                        'User-Agent': 'SEO-Audit-Bot/1.0 (Technical SEO Audit Tool)',
+                        'Accept': 'application/xml, text/xml, */*',
+                        'Accept-Encoding': 'gzip, deflate',
+                        'Accept-Language': 'en-US,en;q=0.9'
+                    }
+                ) as response:
+                    if response.content_length is not None and response.content_length > self.max_bytes:
+                        logger.warning(f"⚠️ Skipping sitemap {sitemap_url}: {response.content_length} bytes exceeds limit of {self.max_bytes}")
+                    elif response.status == 200:
+                        fetched = True
+                        # Track this sitemap as successfully accessed
+                        if sitemap_url not in self._accessed_set:
+                            self._accessed_set.add(sitemap_url)
+                            self.accessed_sitemap_urls.append(sitemap_url)
                         
-                        if nested_sitemap_urls:
-                            logger.info(f"📋 Found {len(nested_sitemap_urls)} nested sitemap(s) in {sitemap_url}")
-                    
-                    # Handle regular sitemap
-                    elif root.tag.endswith('urlset'):
-                        url_locs = root.findall('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                        for loc in url_locs:
-                            if loc.text:
-                                urls.add(loc.text.strip())
-                    
-                    logger.info(f"✅ Extracted {len(urls)} URLs from {sitemap_url}")
-                else:
-                    logger.warning(f"⚠️ Sitemap {sitemap_url} returned status {response.status}")
+                        # Track all found sitemap URLs
+                        if sitemap_url not in self._all_found_set:
+                            self._all_found_set.add(sitemap_url)
+                            self.all_found_sitemap_urls.append(sitemap_url)
+                        
+                        # Stream the body into the XML parser as it arrives instead of
+                        # buffering the whole document and building a full tree
+                        parser = ET.XMLPullParser(events=('end',), **_PULL_PARSER_OPTIONS)
+                        locs: List[str] = []
+                        doc_tag = None
+                        entry_count = 0
+                        decompressor = None
+                        first_chunk = True
+                        received = 0
+                        truncated = False
+                        async for chunk in response.content.iter_chunked(65536):
+                            if first_chunk:
+                                first_chunk = False
+                                # .xml.gz files are often served without Content-Encoding,
+                                # so aiohttp hands us the raw gzip stream
+                                if chunk[:2] == b'\x1f\x8b':
+                                    decompressor = zlib.decompressobj(wbits=31)
+                            if decompressor is not None:
+                                chunk = decompressor.decompress(chunk)
+                            received += len(chunk)
+                            if received > self.max_bytes:
+                                logger.warning(f"⚠️ Sitemap {sitemap_url} exceeds {self.max_bytes} bytes, keeping URLs read so far")
+                                truncated = True
+                                break
+                            parser.feed(chunk)
+                            doc_tag, entry_count = self._drain_sitemap_events(parser, locs, doc_tag, entry_count)
+                        if not truncated:
+                            if decompressor is not None:
+                                parser.feed(decompressor.flush())
+                            parser.close()
+                            doc_tag, entry_count = self._drain_sitemap_events(parser, locs, doc_tag, entry_count)
+                        
+                        # Handle sitemap index
+                        if doc_tag == _INDEX_TAG:
+                            for nested_sitemap_url in locs:
+                                if nested_sitemap_url:
+                                    nested_sitemap_urls.append(nested_sitemap_url)
+                                    # Track nested sitemap URLs found
+                                    if nested_sitemap_url not in self._all_found_set:
+                                        self._all_found_set.add(nested_sitemap_url)
+                                        self.all_found_sitemap_urls.append(nested_sitemap_url)
+                            
+                            if nested_sitemap_urls:
+                                logger.info(f"📋 Found {len(nested_sitemap_urls)} nested sitemap(s) in {sitemap_url}")
+                        
+                        # Handle regular sitemap
+                        elif doc_tag == _URLSET_TAG:
+                            remaining = self.max_urls - url_count[0]
+                            if len(locs) > remaining:
+                                logger.warning(f"⚠️ URL limit of {self.max_urls} reached while reading {sitemap_url}")
+                                del locs[max(remaining, 0):]
+                            url_count[0] += len(locs)
+                            urls.update(loc for loc in locs if loc)
+                    else:
+                        logger.warning(f"⚠️ Sitemap {sitemap_url} returned status {response.status}")
         except ET.ParseError as e:
             logger.error(f"❌ Error parsing sitemap XML {sitemap_url}: {str(e)}")
         except Exception as e:
             logger.warning(f"⚠️ Could not parse sitemap {sitemap_url}: {str(e)}")
         
-        return urls
+        if fetched:
+            logger.info(f"✅ Extracted {len(urls)} URLs from {sitemap_url}")
+        
+        return urls, nested_sitemap_urls
     
-    async def get_all_sitemap_urls(self, session: aiohttp.ClientSession, robots_checker: RobotsChecker) -> Dict:
+    async def get_all_sitemap_urls(self, session: Optional[aiohttp.ClientSession], robots_checker: RobotsChecker) -> Dict:
         """
         Get all URLs from sitemaps following the flow:
         1. First, find sitemap URLs from robots.txt using Gemini (or standard parser)
@@ -325,7 +794,7 @@ class SitemapParser:
         3. Collect all sitemap URLs found (from robots.txt + all nested ones discovered)
         
         Args:
-            session: aiohttp session
+            session: aiohttp session (None uses the shared session)
             robots_checker: RobotsChecker instance
             
         Returns:
@@ -335,9 +804,16 @@ class SitemapParser:
             - 'accessed_sitemap_urls': List of all successfully accessed sitemap URLs (including nested ones)
             - 'total_links_count': Total number of links found in all sitemaps
         """
+        if session is None:
+            session = await get_session()
+        
         # Reset tracking lists for this run
         self.accessed_sitemap_urls = []
         self.all_found_sitemap_urls = []
+        self._accessed_set = set()
+        self._all_found_set = set()
+        self._sitemap_cache = {}
+        self._inflight_sitemaps = {}
         
         # Step 1: Get sitemap URLs from robots.txt using Gemini (or standard parser)
         logger.info("🔍 Step 1: Extracting sitemap URLs from robots.txt...")
@@ -354,11 +830,7 @@ class SitemapParser:
         
         # Step 2: Visit each sitemap from robots.txt and extract URLs (including nested sitemaps)
         logger.info(f"🔍 Step 2: Visiting {len(robots_sitemaps)} sitemap(s) from robots.txt to retrieve all nested sitemap URLs...")
-        all_urls = set()
-        
-        for sitemap_url in robots_sitemaps:
-            urls = await self.parse_sitemap(session, sitemap_url)
-            all_urls.update(urls)
+        all_urls = await self._crawl_sitemaps(session, robots_sitemaps)
         
         self.discovered_urls = all_urls
         total_links_count = len(all_urls)
@@ -366,7 +838,7 @@ class SitemapParser:
         logger.info(f"📊 Total URLs discovered from sitemaps: {total_links_count}")
         logger.info(f"📋 Found {len(self.all_found_sitemap_urls)} total sitemap URL(s) (from robots.txt + nested ones):")
         for idx, sitemap_url in enumerate(self.all_found_sitemap_urls, 1):
-            status = "✅" if sitemap_url in self.accessed_sitemap_urls else "❌"
+            status = "✅" if sitemap_url in self._accessed_set else "❌"
             logger.info(f"   {idx}. {status} {sitemap_url}")
         
         return {
@@ -1,11 +1,245 @@
 """
 Rule engine for scoring and prioritizing SEO issues.
 """
-from typing import Dict, List
+import os
+import re
+import sys
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Pattern, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# NumPy (installed with pandas) lets site-wide totals reduce in one C-level pass
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def _compile_classifier(*rules: Tuple[Tuple[str, ...], str]) -> Pattern:
+    """
+    Compile ordered keyword rules into a single case-insensitive classifier.
+    Each alternative is a lookahead over the whole message, so the first rule
+    whose keywords appear anywhere wins, exactly like an if/elif chain.
+    
+    Args:
+        rules: (keywords, weight_key) pairs in priority order
+        
+    Returns:
+        Compiled pattern; match(issue).lastgroup is the matching weight key and
+        match(issue).lastindex its 1-based position in rules
+    """
+    return re.compile(
+        '|'.join(
+            f"(?=.*?(?:{'|'.join(map(re.escape, keywords))}))(?P<{key}>)"
+            for keywords, key in rules
+        ),
+        re.IGNORECASE | re.DOTALL
+    )
+
+
+# Interned category/severity strings shared by every issue dict, so equality checks
+# in counting and sorting short-circuit on identity
+_CAT_TECHNICAL = sys.intern('Technical')
+_CAT_ONPAGE = sys.intern('On-Page')
+_SEV_CRITICAL = sys.intern('critical')
+_SEV_HIGH = sys.intern('high')
+_SEV_MEDIUM = sys.intern('medium')
+_SEV_LOW = sys.intern('low')
+
+# Severity rank used in issue sort keys (unknown severities rank 4)
+_SEVERITY_RANK = {_SEV_CRITICAL: 0, _SEV_HIGH: 1, _SEV_MEDIUM: 2, _SEV_LOW: 3}
+
+
+# Score dict columns summed by calculate_site_score, fetched in one C-level call per page
+_SCORE_COLUMNS = itemgetter('score', 'issue_count', 'critical_count', 'high_count', 'medium_count', 'low_count')
+
+
+# Result template for pages without issues (copied per page, never returned as-is)
+_CLEAN_RESULT = {
+    'score': 100,
+    'issues': [],
+    'issue_count': 0,
+    'critical_count': 0,
+    'high_count': 0,
+    'medium_count': 0,
+    'low_count': 0
+}
+
+
+# Issue message classifiers, one regex pass per issue instead of repeated lower()/in checks
+_META_ROBOTS_CLASSIFIER = _compile_classifier(
+    (('conflict',), 'meta_robots_conflict'),
+)
+_CANONICAL_CLASSIFIER = _compile_classifier(
+    (('404',), 'canonical_404'),
+    (('homepage',), 'canonical_to_homepage'),
+)
+_REDIRECT_CLASSIFIER = _compile_classifier(
+    (('404',), 'redirect_chain_404'),
+    (('loop',), 'redirect_loop'),
+    (('too long',), 'redirect_chain_too_long'),
+    (('302', 'temporary'), 'redirect_302_temporary'),
+    (('error',), 'server_error'),
+)
+_STRUCTURED_DATA_CLASSIFIER = _compile_classifier(
+    (('no structured data', 'not found'), 'missing_structured_data'),
+    (('duplicate',), 'duplicate_structured_data'),
+)
+_TITLE_CLASSIFIER = _compile_classifier(
+    (('empty',), 'title_empty'),
+    (('too short',), 'title_too_short'),
+    (('too long',), 'title_too_long'),
+    (('template', 'default'), 'title_template_default'),
+    (('duplicate',), 'duplicate_title'),
+)
+_META_DESCRIPTION_CLASSIFIER = _compile_classifier(
+    (('empty',), 'meta_description_empty'),
+    (('too short',), 'meta_description_too_short'),
+    (('too long',), 'meta_description_too_long'),
+    (('duplicate',), 'duplicate_description'),
+)
+_H1_CLASSIFIER = _compile_classifier(
+    (('multiple',), 'multiple_h1'),
+    (('identical', 'same as title'), 'h1_identical_to_title'),
+)
+_INTERNAL_LINKS_CLASSIFIER = _compile_classifier(
+    (('broken',), 'broken_internal_links'),
+    (('excessive', 'too many'), 'excessive_internal_links'),
+    (('anchor text',), 'link_without_anchor_text'),
+)
+
+
+# Scoring rules, evaluated in order. Each rule is
+# (section, condition, classifier, weight_key, type, severity, severity_from_section, message):
+#   - flag rules (classifier None): condition(section) returns how many times the weight
+#     applies (False/0 to skip) and a single issue with `message` is reported
+#   - issue-list rules: when condition is None or condition(section) is true, every message in
+#     section['issues'] is classified; weight_key is the fallback when no classifier rule matches
+#     (None drops unmatched messages) and severity is overridden by section['severity'] if
+#     severity_from_section is set
+_TECHNICAL_RULES = (
+    ('noindex', lambda s: s.get('has_noindex', False), None, 'noindex_on_indexable',
+     'Noindex', _SEV_CRITICAL, False, 'Page has noindex directive'),
+    ('noindex', lambda s: s.get('has_nofollow', False), None, 'nofollow_directive',
+     'Nofollow', _SEV_MEDIUM, False, 'Page has nofollow directive'),
+    ('noindex', None, _META_ROBOTS_CLASSIFIER, None,
+     'Meta Robots', _SEV_HIGH, False, None),
+    ('canonical', None, _CANONICAL_CLASSIFIER, 'canonical_other',
+     'Canonical', _SEV_MEDIUM, True, None),
+    ('redirects', None, _REDIRECT_CLASSIFIER, 'redirect_other',
+     'Redirects', _SEV_MEDIUM, True, None),
+    ('https', lambda s: not s.get('is_https', True), None, 'not_https',
+     'HTTPS', _SEV_CRITICAL, False, 'Page not served over HTTPS'),
+    ('https', lambda s: s.get('mixed_content_count', 0) > 0, None, 'mixed_content_js_css',
+     'Mixed Content', _SEV_HIGH, False, lambda s: f"{s['mixed_content_count']} resource(s) loaded via HTTP"),
+    ('structured_data', None, _STRUCTURED_DATA_CLASSIFIER, 'missing_structured_data',
+     'Structured Data', _SEV_LOW, True, None),
+)
+
+_ONPAGE_RULES = (
+    ('title', lambda s: not s.get('has_title', False), None, 'missing_title',
+     'Title', _SEV_CRITICAL, False, 'Missing title tag'),
+    ('title', lambda s: s.get('has_title', False), _TITLE_CLASSIFIER, 'title_too_short',
+     'Title', _SEV_MEDIUM, True, None),
+    ('meta_description', lambda s: not s.get('has_meta_description', False), None, 'missing_meta_description',
+     'Meta Description', _SEV_HIGH, False, 'Missing meta description'),
+    ('meta_description', lambda s: s.get('has_meta_description', False), _META_DESCRIPTION_CLASSIFIER, 'meta_description_too_short',
+     'Meta Description', _SEV_MEDIUM, True, None),
+    ('h1', lambda s: s.get('h1_count', 0) == 0, None, 'no_h1',
+     'H1', _SEV_HIGH, False, 'No H1 tag found'),
+    ('h1', lambda s: s.get('h1_count', 0) != 0, _H1_CLASSIFIER, 'h1_other',
+     'H1', _SEV_MEDIUM, True, None),
+    # More liberal: reduce impact per image and cap lower (3 missing, 2 empty)
+    ('image_alt', lambda s: min(s.get('images_without_alt', 0), 3), None, 'images_missing_alt',
+     'Image Alt', _SEV_MEDIUM, False, lambda s: f"{s['images_without_alt']} image(s) missing alt text"),
+    ('image_alt', lambda s: min(s.get('images_with_empty_alt', 0), 2), None, 'images_empty_alt',
+     'Image Alt', _SEV_LOW, False, lambda s: f"{s['images_with_empty_alt']} image(s) with empty alt attribute"),
+    ('internal_links', None, _INTERNAL_LINKS_CLASSIFIER, 'internal_links_other',
+     'Internal Links', _SEV_LOW, True, None),
+)
+
+# Every field the rules above read, per section. Page scores are memoized on these
+# values, so this must be kept in sync with the rule tables.
+_TECHNICAL_FIELDS = (
+    ('noindex', ('has_noindex', 'has_nofollow', 'issues')),
+    ('canonical', ('issues', 'severity')),
+    ('redirects', ('issues', 'severity')),
+    ('https', ('is_https', 'mixed_content_count')),
+    ('structured_data', ('issues', 'severity')),
+)
+_ONPAGE_FIELDS = (
+    ('title', ('has_title', 'issues', 'severity')),
+    ('meta_description', ('has_meta_description', 'issues', 'severity')),
+    ('h1', ('h1_count', 'issues', 'severity')),
+    ('image_alt', ('images_without_alt', 'images_with_empty_alt')),
+    ('internal_links', ('issues', 'severity')),
+)
+_MISSING = object()  # Distinguishes absent fields from explicit None in fingerprints
+_EMPTY: Mapping = MappingProxyType({})  # Shared read-only default for absent sections
+
+
+def _fingerprint(results: Dict, fields: Tuple) -> Optional[Tuple]:
+    """
+    Build a hashable key from the audit result fields the scoring rules read.
+    
+    Args:
+        results: Technical or on-page audit results
+        fields: _TECHNICAL_FIELDS or _ONPAGE_FIELDS
+        
+    Returns:
+        Tuple of field values (None if results is empty)
+    """
+    if not results:
+        return None
+    key = []
+    for section_key, names in fields:
+        section = results.get(section_key, _EMPTY)
+        for name in names:
+            value = section.get(name, _MISSING)
+            if isinstance(value, list):
+                value = tuple(value)
+            key.append(value)
+    return tuple(key)
+
+
+def _project(results: Dict, fields: Tuple) -> Dict:
+    """
+    Reduce audit results to the fields the scoring rules read.
+    
+    Args:
+        results: Technical or on-page audit results
+        fields: _TECHNICAL_FIELDS or _ONPAGE_FIELDS
+        
+    Returns:
+        Dict with one (possibly empty) dict per scored section, or results itself if empty
+    """
+    if not results:
+        return results
+    projected = {}
+    for section_key, names in fields:
+        section = results.get(section_key, _EMPTY)
+        projected[section_key] = {name: section[name] for name in names if name in section}
+    return projected
+
+
+_worker_engine = None  # RuleEngine used by score_pages worker processes
+
+
+def _init_scoring_worker(engine_class: type):
+    """Create the per-process engine for score_pages workers."""
+    global _worker_engine
+    _worker_engine = engine_class()
+
+
+def _score_in_worker(page: Tuple[Dict, Dict]) -> Dict:
+    """Score one (technical_results, onpage_results) pair in a worker process."""
+    return _worker_engine.calculate_page_score(*page)
 
 class RuleEngine:
     """Score and prioritize SEO issues based on issue-specific weights only."""
@@ -55,12 +289,48 @@ class RuleEngine:
         'orphan_page': -6
     }
     
+    # Batches smaller than this are scored in-process; below it, pool startup and IPC outweigh the gain
+    PARALLEL_SCORING_THRESHOLD = 5000
+    
     def __init__(self):
         self.base_score = 100  # Starting score
+        
+        # Rule tables with weights resolved once: an int for flag rules, and for
+        # issue-list rules a tuple indexed by match.lastindex (index 0 is the fallback)
+        self._technical_rules = self._resolve_rules(_TECHNICAL_RULES)
+        self._onpage_rules = self._resolve_rules(_ONPAGE_RULES)
+        
+        # Template pages (archives, paginated lists) often score identically, so
+        # scores are memoized on a fingerprint of the fields the rules read
+        self._score_cache: OrderedDict = OrderedDict()
+        self._score_cache_size = 4096
+    
+    def _resolve_rules(self, rules: Tuple[Tuple, ...]) -> List[Tuple]:
+        """
+        Replace each rule's weight key with its weight(s) from ISSUE_WEIGHTS.
+        
+        Args:
+            rules: Rule table (see _TECHNICAL_RULES)
+            
+        Returns:
+            List of rules with the weight_key field replaced by weights
+        """
+        resolved = []
+        for section, condition, classifier, weight_key, issue_type, severity, severity_from_section, message in rules:
+            if classifier is None:
+                weights = self.ISSUE_WEIGHTS[weight_key]
+            else:
+                keys = sorted(classifier.groupindex, key=classifier.groupindex.get)
+                fallback = self.ISSUE_WEIGHTS[weight_key] if weight_key is not None else None
+                weights = (fallback,) + tuple(self.ISSUE_WEIGHTS[key] for key in keys)
+            resolved.append((section, condition, classifier, weights, issue_type, severity, severity_from_section, message))
+        return resolved
     
     def calculate_page_score(self, technical_results: Dict, onpage_results: Dict) -> Dict:
         """
         Calculate SEO score for a single page.
+        Results are memoized per instance; each call returns its own copy, so callers
+        may modify it (e.g. to add orphan-page issues).
         
         Args:
             technical_results: Technical audit results
@@ -69,308 +339,178 @@ class RuleEngine:
         Returns:
             Dict with score and prioritized issues
         """
-        score = self.base_score
-        all_issues = []
+        try:
+            key = (_fingerprint(technical_results, _TECHNICAL_FIELDS), _fingerprint(onpage_results, _ONPAGE_FIELDS))
+            result = self._score_cache.get(key)
+        except TypeError:
+            # Unhashable field values (unexpected result shapes); score without memoizing
+            return self._score_page(technical_results, onpage_results)
         
-        # Process technical issues
-        if technical_results:
-            # Noindex issues
-            noindex = technical_results.get('noindex', {})
-            if noindex.get('has_noindex', False):
-                weight = self.ISSUE_WEIGHTS.get('noindex_on_indexable', -15)
-                score += weight
-                all_issues.append({
-                    'category': 'Technical',
-                    'type': 'Noindex',
-                    'severity': 'critical',
-                    'message': 'Page has noindex directive',
-                    'weight': weight
-                })
-            
-            # Nofollow issues
-            if noindex.get('has_nofollow', False):
-                weight = self.ISSUE_WEIGHTS.get('nofollow_directive', -3)
-                score += weight
-                all_issues.append({
-                    'category': 'Technical',
-                    'type': 'Nofollow',
-                    'severity': 'medium',
-                    'message': 'Page has nofollow directive',
-                    'weight': weight
-                })
-            
-            # Meta robots conflict
-            if noindex.get('issues'):
-                for issue in noindex['issues']:
-                    if 'conflict' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('meta_robots_conflict', -6)
-                        score += weight
-                        all_issues.append({
-                            'category': 'Technical',
-                            'type': 'Meta Robots',
-                            'severity': 'high',
-                            'message': issue,
-                            'weight': weight
-                        })
-            
-            # Canonical issues
-            canonical = technical_results.get('canonical', {})
-            if canonical.get('issues'):
-                for issue in canonical['issues']:
-                    if '404' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('canonical_404', -12)
-                    elif 'homepage' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('canonical_to_homepage', -12)
-                    else:
-                        weight = self.ISSUE_WEIGHTS.get('canonical_other', -6)
-                    
-                    score += weight
-                    all_issues.append({
-                        'category': 'Technical',
-                        'type': 'Canonical',
-                        'severity': canonical.get('severity', 'medium'),
-                        'message': issue,
-                        'weight': weight
-                    })
-            
-            # Redirect issues
-            redirects = technical_results.get('redirects', {})
-            if redirects.get('issues'):
-                for issue in redirects['issues']:
-                    if '404' in issue:
-                        weight = self.ISSUE_WEIGHTS.get('redirect_chain_404', -12)
-                    elif 'loop' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('redirect_loop', -15)
-                    elif 'too long' in issue.lower() or 'chain too long' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('redirect_chain_too_long', -6)
-                    elif '302' in issue or 'temporary' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('redirect_302_temporary', -4)
-                    elif 'server error' in issue.lower() or 'error' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('server_error', -12)
-                    else:
-                        weight = self.ISSUE_WEIGHTS.get('redirect_other', -6)
-                    
-                    score += weight
-                    all_issues.append({
-                        'category': 'Technical',
-                        'type': 'Redirects',
-                        'severity': redirects.get('severity', 'medium'),
-                        'message': issue,
-                        'weight': weight
-                    })
-            
-            # HTTPS issues
-            https = technical_results.get('https', {})
-            if not https.get('is_https', True):
-                weight = self.ISSUE_WEIGHTS.get('not_https', -40)
-                score += weight
-                all_issues.append({
-                    'category': 'Technical',
-                    'type': 'HTTPS',
-                    'severity': 'critical',
-                    'message': 'Page not served over HTTPS',
-                    'weight': weight
-                })
-            
-            if https.get('mixed_content_count', 0) > 0:
-                weight = self.ISSUE_WEIGHTS.get('mixed_content_js_css', -10)
-                score += weight
-                all_issues.append({
-                    'category': 'Technical',
-                    'type': 'Mixed Content',
-                    'severity': 'high',
-                    'message': f"{https['mixed_content_count']} resource(s) loaded via HTTP",
-                    'weight': weight
-                })
-            
-            # Structured data issues
-            structured_data = technical_results.get('structured_data', {})
-            if structured_data.get('issues'):
-                for issue in structured_data['issues']:
-                    if 'no structured data' in issue.lower() or 'not found' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('missing_structured_data', -2)
-                    elif 'duplicate' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('duplicate_structured_data', -2)
-                    else:
-                        weight = self.ISSUE_WEIGHTS.get('missing_structured_data', -2)
-                    
-                    score += weight
-                    all_issues.append({
-                        'category': 'Technical',
-                        'type': 'Structured Data',
-                        'severity': structured_data.get('severity', 'low'),
-                        'message': issue,
-                        'weight': weight
-                    })
+        if result is None:
+            result = self._score_page(technical_results, onpage_results)
+            self._score_cache[key] = result
+            if len(self._score_cache) > self._score_cache_size:
+                self._score_cache.popitem(last=False)
+        else:
+            self._score_cache.move_to_end(key)
         
-        # Process on-page issues
-        if onpage_results:
-            # Title issues
-            title = onpage_results.get('title', {})
-            if not title.get('has_title', False):
-                weight = self.ISSUE_WEIGHTS.get('missing_title', -8)
-                score += weight
-                all_issues.append({
-                    'category': 'On-Page',
-                    'type': 'Title',
-                    'severity': 'critical',
-                    'message': 'Missing title tag',
-                    'weight': weight
-                })
-            elif title.get('issues'):
-                for issue in title['issues']:
-                    # Determine specific issue type
-                    if 'empty' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('title_empty', -8)
-                    elif 'too short' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('title_too_short', -4)
-                    elif 'too long' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('title_too_long', -4)
-                    elif 'template' in issue.lower() or 'default' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('title_template_default', -3)
-                    elif 'duplicate' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('duplicate_title', -4)
-                    else:
-                        weight = self.ISSUE_WEIGHTS.get('title_too_short', -4)  # Default for other title issues
-                    
-                    score += weight
-                    all_issues.append({
-                        'category': 'On-Page',
-                        'type': 'Title',
-                        'severity': title.get('severity', 'medium'),
-                        'message': issue,
-                        'weight': weight
-                    })
-            
-            # Meta description issues
-            meta_desc = onpage_results.get('meta_description', {})
-            if not meta_desc.get('has_meta_description', False):
-                weight = self.ISSUE_WEIGHTS.get('missing_meta_description', -6)
-                score += weight
-                all_issues.append({
-                    'category': 'On-Page',
-                    'type': 'Meta Description',
-                    'severity': 'high',
-                    'message': 'Missing meta description',
-                    'weight': weight
-                })
-            elif meta_desc.get('issues'):
-                for issue in meta_desc['issues']:
-                    # Determine specific issue type
-                    if 'empty' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('meta_description_empty', -6)
-                    elif 'too short' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('meta_description_too_short', -3)
-                    elif 'too long' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('meta_description_too_long', -3)
-                    elif 'duplicate' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('duplicate_description', -2)
-                    else:
-                        weight = self.ISSUE_WEIGHTS.get('meta_description_too_short', -3)  # Default
-                    
-                    score += weight
-                    all_issues.append({
-                        'category': 'On-Page',
-                        'type': 'Meta Description',
-                        'severity': meta_desc.get('severity', 'medium'),
-                        'message': issue,
-                        'weight': weight
-                    })
-            
-            # H1 issues
-            h1 = onpage_results.get('h1', {})
-            if h1.get('h1_count', 0) == 0:
-                weight = self.ISSUE_WEIGHTS.get('no_h1', -6)
-                score += weight
-                all_issues.append({
-                    'category': 'On-Page',
-                    'type': 'H1',
-                    'severity': 'high',
-                    'message': 'No H1 tag found',
-                    'weight': weight
-                })
-            elif h1.get('issues'):
-                for issue in h1['issues']:
-                    if 'multiple' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('multiple_h1', -4)
-                    elif 'identical' in issue.lower() or 'same as title' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('h1_identical_to_title', -2)
-                    else:
-                        weight = self.ISSUE_WEIGHTS.get('h1_other', -3)
-                    score += weight
-                    all_issues.append({
-                        'category': 'On-Page',
-                        'type': 'H1',
-                        'severity': h1.get('severity', 'medium'),
-                        'message': issue,
-                        'weight': weight
-                    })
-            
-            # Image alt issues
-            image_alt = onpage_results.get('image_alt', {})
-            if image_alt.get('images_without_alt', 0) > 0:
-                weight = self.ISSUE_WEIGHTS.get('images_missing_alt', -4)
-                # More liberal: reduce impact per image and cap lower
-                score += weight * min(image_alt['images_without_alt'], 3)  # Cap at 3 instead of 5
-                all_issues.append({
-                    'category': 'On-Page',
-                    'type': 'Image Alt',
-                    'severity': 'medium',
-                    'message': f"{image_alt['images_without_alt']} image(s) missing alt text",
-                    'weight': weight
-                })
+        return {**result, 'issues': [dict(issue) for issue in result['issues']]}
+    
+    def _iter_issues(self, technical_results: Dict, onpage_results: Dict) -> Iterator[Tuple[str, str, str, str, int, int]]:
+        """
+        Evaluate the rule tables for a page, yielding each issue found in rule order.
+        
+        Args:
+            technical_results: Technical audit results
+            onpage_results: On-page audit results
             
-            # Images with empty alt attribute
-            if image_alt.get('images_with_empty_alt', 0) > 0:
-                weight = self.ISSUE_WEIGHTS.get('images_empty_alt', -2)
-                score += weight * min(image_alt['images_with_empty_alt'], 2)  # Cap at 2
-                all_issues.append({
-                    'category': 'On-Page',
-                    'type': 'Image Alt',
-                    'severity': 'low',
-                    'message': f"{image_alt['images_with_empty_alt']} image(s) with empty alt attribute",
-                    'weight': weight
-                })
+        Yields:
+            (category, type, severity, message, weight, score_delta) tuples; score_delta
+            differs from weight for capped per-item penalties such as image alt text
+        """
+        for category, rules, results in (
+            (_CAT_TECHNICAL, self._technical_rules, technical_results),
+            (_CAT_ONPAGE, self._onpage_rules, onpage_results)
+        ):
+            if not results:
+                continue
+            for section_key, condition, classifier, weights, issue_type, severity, severity_from_section, message in rules:
+                section = results.get(section_key, _EMPTY)
+                if classifier is None:
+                    hits = condition(section)
+                    if hits:
+                        yield (category, issue_type, severity,
+                               message if isinstance(message, str) else message(section),
+                               weights, weights * hits)
+                    continue
+                
+                if condition is not None and not condition(section):
+                    continue
+                issues = section.get('issues')
+                if not issues:
+                    continue
+                # Loop invariants for this section: severity and the bound matcher
+                if severity_from_section:
+                    severity = section.get('severity', severity)
+                    if isinstance(severity, str):
+                        severity = sys.intern(severity)
+                classify = classifier.match
+                for issue in issues:
+                    match = classify(issue)
+                    weight = weights[match.lastindex if match else 0]
+                    if weight is not None:
+                        yield category, issue_type, severity, issue, weight, weight
+    
+    def _score_page(self, technical_results: Dict, onpage_results: Dict) -> Dict:
+        """
+        Score a single page against the rule tables (uncached).
+        
+        Args:
+            technical_results: Technical audit results
+            onpage_results: On-page audit results
             
-            # Internal links issues
-            internal_links = onpage_results.get('internal_links', {})
-            if internal_links.get('issues'):
-                for issue in internal_links['issues']:
-                    if 'broken' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('broken_internal_links', -4)
-                    elif 'excessive' in issue.lower() or 'too many' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('excessive_internal_links', -2)
-                    elif 'without anchor text' in issue.lower() or 'anchor text' in issue.lower():
-                        weight = self.ISSUE_WEIGHTS.get('link_without_anchor_text', -2)
-                    else:
-                        weight = self.ISSUE_WEIGHTS.get('internal_links_other', -2)
-                    score += weight
-                    all_issues.append({
-                        'category': 'On-Page',
-                        'type': 'Internal Links',
-                        'severity': internal_links.get('severity', 'low'),
-                        'message': issue,
-                        'weight': weight
-                    })
+        Returns:
+            Dict with score and prioritized issues
+        """
+        score = self.base_score
+        all_issues = []
+        add_issue = all_issues.append
+        # Sort key per issue, packed as severity rank << 16 | abs(weight)
+        severity_rank = _SEVERITY_RANK.get
+        sort_keys = []
+        add_sort_key = sort_keys.append
+        severity_counts = Counter()
+        
+        for category, issue_type, severity, message, weight, score_delta in self._iter_issues(technical_results, onpage_results):
+            score += score_delta
+            severity_counts[severity] += 1
+            add_issue({
+                'category': category,
+                'type': issue_type,
+                'severity': severity,
+                'message': message,
+                'weight': weight
+            })
+            add_sort_key(severity_rank(severity, 4) << 16 | abs(weight))
+        
+        if not all_issues:
+            # Clean page: nothing to sort or count
+            return {**_CLEAN_RESULT, 'score': max(20, score), 'issues': []}
         
         # More liberal scoring: ensure score doesn't go below 20 (instead of 0)
         # This gives pages a minimum score even with many issues
         score = max(20, score)
         
-        # Sort issues by severity (critical first)
-        severity_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        all_issues.sort(key=lambda x: (severity_order.get(x['severity'], 4), abs(x['weight'])), reverse=True)
+        # Sort issues by severity rank, then weight, using the precomputed integer keys
+        if len(all_issues) > 1:
+            order = sorted(range(len(all_issues)), key=sort_keys.__getitem__, reverse=True)
+            all_issues = [all_issues[i] for i in order]
         
         return {
             'score': score,
             'issues': all_issues,
             'issue_count': len(all_issues),
-            'critical_count': len([i for i in all_issues if i['severity'] == 'critical']),
-            'high_count': len([i for i in all_issues if i['severity'] == 'high']),
-            'medium_count': len([i for i in all_issues if i['severity'] == 'medium']),
-            'low_count': len([i for i in all_issues if i['severity'] == 'low'])
+            'critical_count': severity_counts[_SEV_CRITICAL],
+            'high_count': severity_counts[_SEV_HIGH],
+            'medium_count': severity_counts[_SEV_MEDIUM],
+            'low_count': severity_counts[_SEV_LOW]
+        }
+    
+    def calculate_page_score_lite(self, technical_results: Dict, onpage_results: Dict) -> Dict:
+        """
+        Calculate a page's score and issue counts without building the issue list.
+        Use this when only totals are needed (e.g. site-level aggregation).
+        
+        Args:
+            technical_results: Technical audit results
+            onpage_results: On-page audit results
+            
+        Returns:
+            Dict with the same keys as calculate_page_score except 'issues'
+        """
+        score = self.base_score
+        severity_counts = Counter()
+        for _, _, severity, _, _, score_delta in self._iter_issues(technical_results, onpage_results):
+            score += score_delta
+            severity_counts[severity] += 1
+        
+        return {
+            'score': max(20, score),
+            'issue_count': sum(severity_counts.values()),
+            'critical_count': severity_counts[_SEV_CRITICAL],
+            'high_count': severity_counts[_SEV_HIGH],
+            'medium_count': severity_counts[_SEV_MEDIUM],
+            'low_count': severity_counts[_SEV_LOW]
         }
     
+    def score_pages(self, pages: List[Tuple[Dict, Dict]], max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Score many pages, fanning large batches out to worker processes.
+        Only the fields the rules read are sent to the workers, which each score
+        with a fresh engine of this class.
+        
+        Args:
+            pages: List of (technical_results, onpage_results) tuples
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            List of score dicts in the same order as pages
+        """
+        if len(pages) < self.PARALLEL_SCORING_THRESHOLD:
+            return [self.calculate_page_score(technical, onpage) for technical, onpage in pages]
+        
+        workers = max_workers or os.cpu_count() or 1
+        payload = [
+            (_project(technical, _TECHNICAL_FIELDS), _project(onpage, _ONPAGE_FIELDS))
+            for technical, onpage in pages
+        ]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_scoring_worker,
+            initargs=(type(self),)
+        ) as executor:
+            return list(executor.map(_score_in_worker, payload, chunksize=max(1, len(payload) // (workers * 4))))
+    
     def calculate_site_score(self, all_page_scores: List[Dict]) -> Dict:
         """
         Calculate overall site score from all page scores.
@@ -400,24 +540,27 @@ class RuleEngine:
                 # Already a score dict
                 score_dicts.append(page)
         
-        total_score = sum(score['score'] for score in score_dicts)
+        # Sum score and every issue count column at once
+        rows = list(map(_SCORE_COLUMNS, score_dicts))
+        if NUMPY_AVAILABLE:
+            totals = np.array(rows, dtype=np.int64).sum(axis=0).tolist()
+        else:
+            totals = [sum(column) for column in zip(*rows)]
+        total_score, total_issues, total_critical, total_high, total_medium, total_low = totals
+        
         average_score = total_score / len(score_dicts)
         
         # Use average score directly without scaling
         # This allows sites to achieve scores up to 100
         final_average_score = average_score
         
-        total_issues = sum(score['issue_count'] for score in score_dicts)
-        total_critical = sum(score['critical_count'] for score in score_dicts)
-        total_high = sum(score['high_count'] for score in score_dicts)
-        
         return {
             'average_score': round(final_average_score, 2),
             'total_pages': len(score_dicts),
             'total_issues': total_issues,
             'critical_issues': total_critical,
             'high_issues': total_high,
-            'medium_issues': sum(score['medium_count'] for score in score_dicts),
-            'low_issues': sum(score['low_count'] for score in score_dicts)
+            'medium_issues': total_medium,
+            'low_issues': total_low
         }
 
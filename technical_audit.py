@@ -1,77 +1,176 @@
 """
 Technical SEO audit module: noindex, canonical, redirects, HTTPS, structured data.
 """
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import extruct
-from typing import Dict, List, Optional
+import lxml.html
+from lxml import etree
+from typing import Dict, List, Optional, Tuple
 import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from urllib.parse import urlparse
 import json
 import re
 
+from utils import normalize_url
+
 logger = logging.getLogger(__name__)
 
+# Cheap pre-check on the raw HTML: any attribute value that could start with http://
+# (values may also begin with a character reference, which the parser decodes). Not
+# anchored on src/href: a leading name alternation makes the scan over 10x slower
+_MIXED_CONTENT_RE = re.compile(r'=\s*["\']?(?:http://|&)', re.I)
+
+# src/href values of the resources checked for mixed content, returned as strings by libxml2
+# (kept as separate expressions: a union has to be re-sorted into document order)
+_IMAGE_SRC_XPATH = etree.XPath("//img/@src")
+_SCRIPT_SRC_XPATH = etree.XPath("//script/@src")
+_STYLESHEET_HREF_XPATH = etree.XPath(
+    "//link[contains(concat(' ', normalize-space(@rel), ' '), ' stylesheet ')]/@href"
+)
+
+# Parse-only filters for auditors called on their own; audit_page shares one full parse instead
+_META_STRAINER = SoupStrainer('meta')
+_LINK_STRAINER = SoupStrainer('link')
+_RESOURCE_STRAINER = SoupStrainer(['img', 'script', 'link'])
+_JSON_LD_STRAINER = SoupStrainer('script', type='application/ld+json')
+
+# Severity ranks, so escalating is a max() instead of chained string compares
+_LOW, _MEDIUM, _HIGH, _CRITICAL = range(4)
+_SEVERITY_NAMES = ('low', 'medium', 'high', 'critical')
+
+# Markers without which extruct cannot find any Microdata or RDFa items
+_MICRODATA_RDFA_RE = re.compile(r'itemscope|typeof|rdf:type', re.I)
+
+# Syntaxes audit_structured_data reads from extruct
+_EXTRUCT_SYNTAXES = ('json-ld', 'microdata', 'rdfa')
+
+
+def _scan_directives(content: str, source: str, issues: List[str]) -> Tuple[bool, bool]:
+    """
+    Record the noindex/nofollow directives in a robots directive string.
+    
+    Args:
+        content: Lowercased meta robots content or X-Robots-Tag value
+        source: Where the directives came from, used in issue messages
+        issues: List to append the found directives to
+        
+    Returns:
+        Tuple of (has_noindex, has_nofollow)
+    """
+    has_noindex = 'noindex' in content
+    has_nofollow = 'nofollow' in content
+    if has_noindex:
+        issues.append(f"{source} contains 'noindex'")
+    if has_nofollow:
+        issues.append(f"{source} contains 'nofollow'")
+    return has_noindex, has_nofollow
+
+
+def _flatten_json_ld_graphs(items: List) -> List:
+    """
+    Replace untyped @graph wrappers (as emitted by Yoast, RankMath, ...) with their members.
+    Each member inherits the wrapper's @context unless it declares its own.
+    
+    Args:
+        items: Top-level JSON-LD items
+        
+    Returns:
+        List of JSON-LD items with @graph members in place of their wrapper
+    """
+    flattened = []
+    for item in items:
+        if isinstance(item, dict) and '@type' not in item and isinstance(item.get('@graph'), list):
+            context = item.get('@context')
+            for node in item['@graph']:
+                if isinstance(node, dict) and context is not None and '@context' not in node:
+                    node = {'@context': context, **node}
+                flattened.append(node)
+        else:
+            flattened.append(item)
+    return flattened
+
+
+_worker_auditor = None  # TechnicalAuditor used by batch_audit worker processes
+
+
+def _init_audit_worker(auditor_class: type, base_url: str):
+    """Create the per-process auditor for batch_audit workers."""
+    global _worker_auditor
+    _worker_auditor = auditor_class(base_url)
+
+
+def _audit_in_worker(page: Tuple[str, str, int, Dict, List[str]]) -> Dict:
+    """Audit one (url, html, status_code, headers, redirect_chain) tuple in a worker process."""
+    return _worker_auditor.audit_page(*page)
+
 
 class TechnicalAuditor:
     """Perform technical SEO audits on crawled pages."""
     
+    # Below this many pages batch_audit stays in-process (pool startup and pickling HTML cost more)
+    PARALLEL_AUDIT_THRESHOLD = 200
+    
+    # Matched against every <meta name=...>; anchored so names like "description" fail fast
+    _ROBOTS_RE = re.compile(r'^(?:robots|googlebot)$', re.I)
+    
     def __init__(self, base_url: str):
         self.base_url = base_url
         self.base_domain = urlparse(base_url).netloc
+        # LRU of structured data results keyed on the page HTML itself, so re-audits skip extraction
+        self._sd_cache: OrderedDict = OrderedDict()
+        self._sd_cache_size = 1024
     
-    def audit_noindex(self, html: str, headers: Dict) -> Dict:
+    def audit_noindex(self, html: str, headers: Dict, soup: Optional[BeautifulSoup] = None) -> Dict:
         """
         Check for noindex directives in meta tags and headers.
         
         Args:
             html: HTML content
             headers: HTTP response headers
+            soup: Pre-parsed document (if None, only <meta> tags are parsed from html)
             
         Returns:
             Dict with audit results
         """
         issues = []
-        severity = "low"
+        severity_rank = _LOW
         has_noindex = False
         has_nofollow = False
         
         try:
-            soup = BeautifulSoup(html, 'lxml')
+            if soup is None:
+                soup = BeautifulSoup(html, 'lxml', parse_only=_META_STRAINER)
             
             # Check meta robots tag
-            meta_robots = soup.find('meta', attrs={'name': re.compile(r'robots|googlebot', re.I)})
+            meta_robots = soup.find('meta', attrs={'name': self._ROBOTS_RE})
+            meta_noindex = False
             if meta_robots:
-                content = meta_robots.get('content', '').lower()
-                if 'noindex' in content:
-                    issues.append("Meta robots tag contains 'noindex'")
-                    has_noindex = True
-                    severity = "critical"
-                if 'nofollow' in content:
-                    issues.append("Meta robots tag contains 'nofollow'")
-                    has_nofollow = True
-                    if severity != "critical":
-                        severity = "medium"
+                meta_noindex, meta_nofollow = _scan_directives(
+                    meta_robots.get('content', '').lower(), "Meta robots tag", issues
+                )
+                has_noindex |= meta_noindex
+                has_nofollow |= meta_nofollow
             
             # Check X-Robots-Tag header
             x_robots = headers.get('X-Robots-Tag', '').lower()
+            header_noindex = False
             if x_robots:
-                if 'noindex' in x_robots:
-                    issues.append("X-Robots-Tag header contains 'noindex'")
-                    has_noindex = True
-                    severity = "critical"
-                if 'nofollow' in x_robots:
-                    issues.append("X-Robots-Tag header contains 'nofollow'")
-                    has_nofollow = True
-                    if severity != "critical":
-                        severity = "medium"
+                header_noindex, header_nofollow = _scan_directives(x_robots, "X-Robots-Tag header", issues)
+                has_noindex |= header_noindex
+                has_nofollow |= header_nofollow
+            
+            if has_noindex:
+                severity_rank = _CRITICAL
+            elif has_nofollow:
+                severity_rank = _MEDIUM
             
             # Check for conflicts
-            if meta_robots and x_robots:
-                meta_content = meta_robots.get('content', '').lower()
-                if ('noindex' in meta_content and 'noindex' not in x_robots) or \
-                   ('noindex' not in meta_content and 'noindex' in x_robots):
-                    issues.append("Conflict between meta robots tag and X-Robots-Tag header")
-                    severity = "high"
+            if meta_robots and x_robots and meta_noindex != header_noindex:
+                issues.append("Conflict between meta robots tag and X-Robots-Tag header")
+                severity_rank = max(severity_rank, _HIGH)
             
         except Exception as e:
             logger.warning(f"⚠️ Error checking noindex: {str(e)}")
@@ -81,16 +180,17 @@ class TechnicalAuditor:
             'has_nofollow': has_nofollow,
             'status': 'error' if has_noindex else 'good',
             'issues': issues,
-            'severity': severity
+            'severity': _SEVERITY_NAMES[severity_rank]
         }
     
-    def audit_meta_robots(self, html: str, headers: Dict) -> Dict:
+    def audit_meta_robots(self, html: str, headers: Dict, soup: Optional[BeautifulSoup] = None) -> Dict:
         """
         Check meta robots tag separately (for reporting).
         
         Args:
             html: HTML content
             headers: HTTP response headers
+            soup: Pre-parsed document (if None, only <meta> tags are parsed from html)
             
         Returns:
             Dict with audit results
@@ -102,10 +202,11 @@ class TechnicalAuditor:
         severity = "low"
         
         try:
-            soup = BeautifulSoup(html, 'lxml')
+            if soup is None:
+                soup = BeautifulSoup(html, 'lxml', parse_only=_META_STRAINER)
             
             # Check meta robots tag
-            meta_robots = soup.find('meta', attrs={'name': re.compile(r'robots|googlebot', re.I)})
+            meta_robots = soup.find('meta', attrs={'name': self._ROBOTS_RE})
             if meta_robots:
                 has_meta_robots = True
                 meta_content = meta_robots.get('content', '')
@@ -134,47 +235,48 @@ class TechnicalAuditor:
             'severity': severity
         }
     
-    def audit_canonical(self, html: str, page_url: str) -> Dict:
+    def audit_canonical(self, html: str, page_url: str, soup: Optional[BeautifulSoup] = None) -> Dict:
         """
         Check canonical tag implementation.
         
         Args:
             html: HTML content
             page_url: URL of the page
+            soup: Pre-parsed document (if None, only <link> tags are parsed from html)
             
         Returns:
             Dict with audit results
         """
         issues = []
-        severity = "low"
+        severity_rank = _LOW
         canonical_url = None
         status = "good"
         
         try:
-            soup = BeautifulSoup(html, 'lxml')
+            if soup is None:
+                soup = BeautifulSoup(html, 'lxml', parse_only=_LINK_STRAINER)
             
             # Find canonical tag
             canonical = soup.find('link', attrs={'rel': 'canonical'})
             
             if not canonical:
                 issues.append("Missing canonical tag")
-                severity = "high"
+                severity_rank = max(severity_rank, _HIGH)
                 status = "error"
             else:
                 canonical_url = canonical.get('href', '')
                 if not canonical_url:
                     issues.append("Canonical tag has empty href")
-                    severity = "high"
+                    severity_rank = max(severity_rank, _HIGH)
                     status = "error"
                 else:
                     # Check if canonical points to homepage incorrectly
-                    from urllib.parse import urlparse
                     canonical_parsed = urlparse(canonical_url)
                     page_parsed = urlparse(page_url)
                     
                     if canonical_parsed.path == '/' and page_parsed.path != '/':
                         issues.append("Canonical points to homepage instead of current page")
-                        severity = "critical"
+                        severity_rank = max(severity_rank, _CRITICAL)
                         status = "error"
                     
                     # Check if canonical is self-referential (good)
@@ -182,11 +284,10 @@ class TechnicalAuditor:
                         status = "good"  # This is correct
                     else:
                         # Check if it's a relative URL that resolves to same page
-                        from utils import normalize_url
                         normalized_canonical = normalize_url(canonical_url, page_url)
                         if normalized_canonical != normalize_url(page_url):
                             issues.append(f"Canonical points to different URL: {canonical_url}")
-                            severity = "medium"
+                            severity_rank = max(severity_rank, _MEDIUM)
                             status = "warning"
             
         except Exception as e:
@@ -198,7 +299,7 @@ class TechnicalAuditor:
             'canonical_url': canonical_url,
             'status': status,
             'issues': issues,
-            'severity': severity
+            'severity': _SEVERITY_NAMES[severity_rank]
         }
     
     def audit_redirects(self, status_code: int, redirect_chain: List[str]) -> Dict:
@@ -213,7 +314,7 @@ class TechnicalAuditor:
             Dict with audit results
         """
         issues = []
-        severity = "low"
+        severity_rank = _LOW
         status = "good"
         
         # Check status code
@@ -223,15 +324,15 @@ class TechnicalAuditor:
             status = "info"  # Permanent redirect - usually OK
         elif status_code == 302:
             issues.append("Uses 302 (temporary) redirect instead of 301")
-            severity = "medium"
+            severity_rank = max(severity_rank, _MEDIUM)
             status = "warning"
         elif status_code == 404:
             issues.append("Redirect chain ends in 404")
-            severity = "critical"
+            severity_rank = max(severity_rank, _CRITICAL)
             status = "error"
         elif status_code >= 500:
             issues.append(f"Server error: {status_code}")
-            severity = "critical"
+            severity_rank = max(severity_rank, _CRITICAL)
             status = "error"
         elif 300 <= status_code < 400:
             status = "info"
@@ -239,83 +340,73 @@ class TechnicalAuditor:
         # Check redirect chain length
         if len(redirect_chain) > 2:
             issues.append(f"Redirect chain too long ({len(redirect_chain)} hops)")
-            severity = "high"
+            severity_rank = max(severity_rank, _HIGH)
             status = "error"
         
-        # Check for redirect loops
-        if len(redirect_chain) != len(set(redirect_chain)):
-            issues.append("Redirect loop detected")
-            severity = "critical"
-            status = "error"
+        # Check for redirect loops, stopping at the first repeated URL
+        seen = set()
+        for hop in redirect_chain:
+            if hop in seen:
+                issues.append("Redirect loop detected")
+                severity_rank = max(severity_rank, _CRITICAL)
+                status = "error"
+                break
+            seen.add(hop)
         
         return {
             'status_code': status_code,
             'redirect_chain_length': len(redirect_chain),
             'status': status,
             'issues': issues,
-            'severity': severity
+            'severity': _SEVERITY_NAMES[severity_rank]
         }
     
-    def audit_https(self, url: str, html: str) -> Dict:
+    def audit_https(self, url: str, html: str, soup: Optional[BeautifulSoup] = None) -> Dict:
         """
         Check HTTPS implementation and mixed content.
         
         Args:
             url: Page URL
             html: HTML content
+            soup: Pre-parsed document (parsed from html if None)
             
         Returns:
             Dict with audit results
         """
         issues = []
-        severity = "low"
+        severity_rank = _LOW
         mixed_content_count = 0
         
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             is_https = parsed.scheme == 'https'
             
             # Check if page is HTTPS
             if not is_https:
                 issues.append("Page is not served over HTTPS")
-                severity = "critical"
                 return {
                     'is_https': False,
                     'mixed_content_count': 0,
                     'issues': issues,
-                    'severity': severity
+                    'severity': "critical"
                 }
             
             # Check for mixed content
-            soup = BeautifulSoup(html, 'lxml')
+            http_images, http_scripts, http_stylesheets = self._find_http_resources(html, soup)
             
-            # Check images
-            for img in soup.find_all('img', src=True):
-                src = img.get('src', '')
-                if src.startswith('http://'):
-                    mixed_content_count += 1
-                    issues.append(f"Image loaded via HTTP: {src[:50]}...")
-            
-            # Check scripts
-            for script in soup.find_all('script', src=True):
-                src = script.get('src', '')
-                if src.startswith('http://'):
-                    mixed_content_count += 1
-                    issues.append(f"Script loaded via HTTP: {src[:50]}...")
-                    severity = "high" if severity != "critical" else severity
-            
-            # Check stylesheets
-            for link in soup.find_all('link', rel='stylesheet', href=True):
-                href = link.get('href', '')
-                if href.startswith('http://'):
-                    mixed_content_count += 1
-                    issues.append(f"Stylesheet loaded via HTTP: {href[:50]}...")
-                    severity = "high" if severity != "critical" else severity
+            for src in http_images:
+                issues.append(f"Image loaded via HTTP: {src[:50]}...")
+            for src in http_scripts:
+                issues.append(f"Script loaded via HTTP: {src[:50]}...")
+            for href in http_stylesheets:
+                issues.append(f"Stylesheet loaded via HTTP: {href[:50]}...")
+            
+            mixed_content_count = len(http_images) + len(http_scripts) + len(http_stylesheets)
+            if http_scripts or http_stylesheets:
+                severity_rank = max(severity_rank, _HIGH)
             
             if mixed_content_count > 0:
-                if severity != "high" and severity != "critical":
-                    severity = "medium"
+                severity_rank = max(severity_rank, _MEDIUM)
         
         except Exception as e:
             logger.warning(f"⚠️ Error checking HTTPS: {str(e)}")
@@ -326,43 +417,151 @@ class TechnicalAuditor:
             'mixed_content_count': mixed_content_count,
             'status': 'good' if is_https and mixed_content_count == 0 else ('warning' if is_https else 'error'),
             'issues': issues[:10],  # Limit to first 10 issues
-            'severity': severity
+            'severity': _SEVERITY_NAMES[severity_rank]
         }
     
-    def audit_structured_data(self, html: str) -> Dict:
+    def _find_http_resources(self, html: str, soup: Optional[BeautifulSoup]) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Collect image, script and stylesheet URLs loaded over plain HTTP.
+        
+        Without a shared soup the URLs are pulled straight out of an lxml tree with
+        XPath, which avoids building a BeautifulSoup object per tag.
+        
+        Args:
+            html: HTML content
+            soup: Pre-parsed document, or None
+            
+        Returns:
+            Tuple of (image URLs, script URLs, stylesheet URLs), each in document order
+        """
+        # Most HTTPS pages have no plain-HTTP attribute at all; skip the tree entirely
+        if not _MIXED_CONTENT_RE.search(html):
+            return [], [], []
+        
+        if soup is None:
+            try:
+                tree = lxml.html.fromstring(html)
+            except (ValueError, etree.LxmlError):
+                # Empty documents and str input with an XML encoding declaration
+                soup = BeautifulSoup(html, 'lxml', parse_only=_RESOURCE_STRAINER)
+            else:
+                return tuple(
+                    [str(value) for value in xpath(tree) if value.startswith('http://')]
+                    for xpath in (_IMAGE_SRC_XPATH, _SCRIPT_SRC_XPATH, _STYLESHEET_HREF_XPATH)
+                )
+        
+        http_images, http_scripts, http_stylesheets = [], [], []
+        # Single walk, grouped so issues keep image/script/stylesheet order
+        for tag in soup.find_all(('img', 'script', 'link')):
+            name = tag.name
+            if name == 'link':
+                if 'stylesheet' not in (tag.get('rel') or ()):
+                    continue
+                src = tag.get('href')
+                bucket = http_stylesheets
+            else:
+                src = tag.get('src')
+                bucket = http_images if name == 'img' else http_scripts
+            if src and src.startswith('http://'):
+                bucket.append(src)
+        
+        return http_images, http_scripts, http_stylesheets
+    
+    def _extract_json_ld(self, soup: BeautifulSoup) -> Optional[List]:
+        """
+        Read JSON-LD blocks straight from the parsed document.
+        
+        Args:
+            soup: Parsed document
+            
+        Returns:
+            List of JSON-LD items as extruct reports them, or None if a block needs
+            extruct's more lenient parsing (e.g. wrapped in HTML comments)
+        """
+        items = []
+        for script in soup.find_all('script', type='application/ld+json'):
+            try:
+                data = json.loads(script.get_text(), strict=False)
+            except ValueError:
+                return None
+            if isinstance(data, list):
+                items.extend(data)
+            elif isinstance(data, dict):
+                items.append(data)
+        return items
+    
+    def audit_structured_data(self, html: str, soup: Optional[BeautifulSoup] = None) -> Dict:
         """
         Check structured data (JSON-LD, Microdata, RDFa).
+        Results are memoized per instance; each call returns its own copy.
         
         Args:
             html: HTML content
+            soup: Pre-parsed document (parsed from html if None)
+            
+        Returns:
+            Dict with audit results
+        """
+        result = self._sd_cache.get(html)
+        if result is None:
+            result = self._audit_structured_data(html, soup)
+            self._sd_cache[html] = result
+            if len(self._sd_cache) > self._sd_cache_size:
+                self._sd_cache.popitem(last=False)
+        else:
+            self._sd_cache.move_to_end(html)
+        
+        return {
+            **result,
+            'schema_types': list(result['schema_types']),
+            'errors': list(result['errors']),
+            'issues': list(result['issues'])
+        }
+    
+    def _audit_structured_data(self, html: str, soup: Optional[BeautifulSoup] = None) -> Dict:
+        """
+        Check structured data for a page (uncached).
+        
+        JSON-LD is read from the parsed page directly; extruct only runs when the page
+        may carry Microdata/RDFa or a JSON-LD block does not parse as plain JSON.
+        
+        Args:
+            html: HTML content
+            soup: Pre-parsed document (if None, only <script type="application/ld+json"> tags are parsed from html)
             
         Returns:
             Dict with audit results
         """
         issues = []
-        severity = "low"
+        severity_rank = _LOW
         schemas = []
         errors = []
         
         try:
+            if soup is None:
+                soup = BeautifulSoup(html, 'lxml', parse_only=_JSON_LD_STRAINER)
+            
             # Extract structured data
-            data = extruct.extract(html, uniform=True)
+            json_ld = self._extract_json_ld(soup)
+            if json_ld is not None and not _MICRODATA_RDFA_RE.search(html):
+                data = {}
+            else:
+                syntaxes = [syntax for syntax in _EXTRUCT_SYNTAXES if syntax != 'json-ld' or json_ld is None]
+                data = extruct.extract(html, syntaxes=syntaxes, uniform=True)
             
             # Check JSON-LD
-            json_ld = data.get('@graph', []) if '@graph' in data else []
-            if not json_ld:
+            if json_ld is None:
                 json_ld = data.get('json-ld', [])
             
-            for item in json_ld:
+            for item in _flatten_json_ld_graphs(json_ld):
                 if isinstance(item, dict):
                     # Check for required fields
                     if '@type' not in item:
                         errors.append("JSON-LD missing @type")
-                        severity = "high"
+                        severity_rank = max(severity_rank, _HIGH)
                     if '@context' not in item:
                         errors.append("JSON-LD missing @context")
-                        if severity != "high":
-                            severity = "medium"
+                        severity_rank = max(severity_rank, _MEDIUM)
                     
                     schema_type = item.get('@type', 'Unknown')
                     schemas.append(schema_type)
@@ -370,8 +569,7 @@ class TechnicalAuditor:
             # Check for duplicate schemas
             if len(schemas) != len(set(schemas)):
                 issues.append("Duplicate structured data types detected")
-                if severity != "high":
-                    severity = "medium"
+                severity_rank = max(severity_rank, _MEDIUM)
             
             # Check Microdata
             microdata = data.get('microdata', [])
@@ -385,12 +583,11 @@ class TechnicalAuditor:
             
             if not schemas:
                 issues.append("No structured data found")
-                severity = "low"
         
         except Exception as e:
             logger.warning(f"⚠️ Error checking structured data: {str(e)}")
             errors.append(f"Error parsing structured data: {str(e)}")
-            severity = "medium"
+            severity_rank = max(severity_rank, _MEDIUM)
         
         return {
             'has_structured_data': len(schemas) > 0,
@@ -399,7 +596,7 @@ class TechnicalAuditor:
             'errors': errors,
             'status': 'good' if len(schemas) > 0 and len(errors) == 0 else ('warning' if len(errors) > 0 else 'info'),
             'issues': issues,
-            'severity': severity
+            'severity': _SEVERITY_NAMES[severity_rank]
         }
     
     def audit_page(self, url: str, html: str, status_code: int, headers: Dict, redirect_chain: List[str]) -> Dict:
@@ -416,15 +613,45 @@ class TechnicalAuditor:
         Returns:
             Dict with all audit results
         """
+        # Parse once and share the tree across the HTML-based audits
+        try:
+            soup = BeautifulSoup(html, 'lxml')
+        except Exception as e:
+            logger.warning(f"⚠️ Error parsing HTML for {url}: {str(e)}")
+            soup = None
+        
         results = {
             'url': url,
-            'noindex': self.audit_noindex(html, headers),
-            'meta_robots': self.audit_meta_robots(html, headers),
-            'canonical': self.audit_canonical(html, url),
+            'noindex': self.audit_noindex(html, headers, soup),
+            'meta_robots': self.audit_meta_robots(html, headers, soup),
+            'canonical': self.audit_canonical(html, url, soup),
             'redirects': self.audit_redirects(status_code, redirect_chain),
-            'https': self.audit_https(url, html),
-            'structured_data': self.audit_structured_data(html)
+            'https': self.audit_https(url, html, soup),
+            'structured_data': self.audit_structured_data(html, soup)
         }
         
         return results
-
+    
+    def batch_audit(self, pages: List[Tuple[str, str, int, Dict, List[str]]], max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Audit many pages, fanning large batches out to worker processes.
+        HTML parsing holds the GIL, so worker processes scale where threads would not;
+        each worker audits with a fresh auditor of this class for the same base URL.
+        
+        Args:
+            pages: List of (url, html, status_code, headers, redirect_chain) tuples
+            max_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            List of audit result dicts in the same order as pages
+        """
+        if len(pages) < self.PARALLEL_AUDIT_THRESHOLD:
+            return [self.audit_page(*page) for page in pages]
+        
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_audit_worker,
+            initargs=(type(self), self.base_url)
+        ) as executor:
+            return list(executor.map(_audit_in_worker, pages, chunksize=max(1, len(pages) // (workers * 4))))
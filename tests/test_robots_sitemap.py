@@ -0,0 +1,165 @@
+"""
+Tests for robots.txt rule matching and sitemap crawling.
+"""
+import asyncio
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import pytest
+
+from robots_sitemap import RobotsChecker, SitemapParser
+
+
+def make_checker(robots_txt: str) -> RobotsChecker:
+    """Build a RobotsChecker from robots.txt content without fetching it."""
+    checker = RobotsChecker('https://example.com')
+    checker.parser = object()  # Marks robots.txt as present
+    checker._robots_groups = RobotsChecker._parse_robots_groups(robots_txt)
+    return checker
+
+
+def test_longer_disallow_beats_blanket_allow():
+    checker = make_checker("User-agent: *\nDisallow: /private\nAllow: /\n")
+    assert not checker.can_fetch('https://example.com/private/x')
+    assert checker.can_fetch('https://example.com/public')
+
+
+def test_longer_allow_beats_blanket_disallow():
+    checker = make_checker("User-agent: *\nDisallow: /\nAllow: /public\n")
+    assert checker.can_fetch('https://example.com/public/x')
+    assert not checker.can_fetch('https://example.com/other')
+
+
+def test_allow_wins_tie():
+    checker = make_checker("User-agent: *\nDisallow: /page\nAllow: /page\n")
+    assert checker.can_fetch('https://example.com/page')
+
+
+@pytest.mark.parametrize('base_url', [
+    'https://example.com',
+    'https://example.com/blog',
+    'https://example.com/?ref=x',
+])
+def test_relative_sitemap_resolves_against_origin(base_url):
+    checker = RobotsChecker(base_url)
+    checker.robots_content = (
+        "User-agent: *\nSitemap: /sitemap.xml\n"
+        "Sitemap: https://cdn.example.com/news.xml\n"
+    )
+    assert checker.extract_sitemaps_fast() == [
+        'https://example.com/sitemap.xml',
+        'https://cdn.example.com/news.xml',
+    ]
+
+
+class FakeContent:
+    def __init__(self, body: bytes):
+        self._body = body
+    
+    async def iter_chunked(self, size: int):
+        for start in range(0, len(self._body), size):
+            yield self._body[start:start + size]
+
+
+class FakeResponse:
+    def __init__(self, body: Optional[bytes]):
+        self.status = 200 if body is not None else 404
+        self.content_length = len(body) if body is not None else None
+        self.content = FakeContent(body or b'')
+    
+    async def text(self) -> str:
+        return self.content._body.decode()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """Serves sitemap bodies from a dict instead of the network."""
+    
+    def __init__(self, pages: Dict[str, bytes]):
+        self.pages = pages
+    
+    def get(self, url: str, **kwargs) -> FakeResponse:
+        return FakeResponse(self.pages.get(url))
+
+
+def sitemap_pages() -> Dict[str, bytes]:
+    """A sitemap index with two child sitemaps of three URLs each."""
+    ns = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+    pages = {
+        'https://example.com/sitemap_index.xml': (
+            f'<sitemapindex {ns}>'
+            '<sitemap><loc>https://example.com/sitemap-1.xml</loc></sitemap>'
+            '<sitemap><loc>https://example.com/sitemap-2.xml</loc></sitemap>'
+            '</sitemapindex>'
+        ).encode(),
+    }
+    for n in (1, 2):
+        locs = ''.join(f'<url><loc>https://example.com/{n}/{i}</loc></url>' for i in range(3))
+        pages[f'https://example.com/sitemap-{n}.xml'] = f'<urlset {ns}>{locs}</urlset>'.encode()
+    return pages
+
+
+def test_parse_sitemap_twice_on_index():
+    parser = SitemapParser('https://example.com')
+    session = FakeSession(sitemap_pages())
+    index_url = 'https://example.com/sitemap_index.xml'
+    
+    async def run():
+        child = await parser.parse_sitemap(session, 'https://example.com/sitemap-1.xml')
+        # The index nests the sitemap crawled above; it must still be followed
+        first = await parser.parse_sitemap(session, index_url)
+        second = await parser.parse_sitemap(session, index_url)
+        return child, first, second
+    
+    child, first, second = asyncio.run(run())
+    assert child == {f'https://example.com/1/{i}' for i in range(3)}
+    assert len(first) == 6
+    assert second == first
+
+
+def test_robots_cache_is_bounded_and_locks_are_released(monkeypatch):
+    monkeypatch.setattr(RobotsChecker, '_ROBOTS_CACHE', OrderedDict())
+    monkeypatch.setattr(RobotsChecker, '_ROBOTS_CACHE_SIZE', 2)
+    sites = [f'https://site{n}.example' for n in range(3)]
+    session = FakeSession({f'{site}/robots.txt': b'User-agent: *\nDisallow: /admin\n' for site in sites})
+    
+    async def run():
+        checkers = [RobotsChecker(site) for site in sites]
+        return await asyncio.gather(*(checker.fetch_robots(session) for checker in checkers))
+    
+    assert asyncio.run(run()) == [True, True, True]
+    assert list(RobotsChecker._ROBOTS_CACHE) == [f'{site}/robots.txt' for site in sites[1:]]
+    assert RobotsChecker._ROBOTS_LOCKS == {}
+
+
+def test_large_sitemap_keeps_every_url_while_pruning_entries():
+    ns = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+    # Entries without <loc> up front, then enough URLs to trigger several prunes
+    entries = '<url></url>' * 50 + ''.join(f'<url><loc>https://example.com/p/{i}</loc></url>' for i in range(25_000))
+    sitemap_url = 'https://example.com/sitemap.xml'
+    session = FakeSession({sitemap_url: f'<urlset {ns}>{entries}</urlset>'.encode()})
+    
+    urls = asyncio.run(SitemapParser('https://example.com').parse_sitemap(session, sitemap_url))
+    
+    assert len(urls) == 25_000
+
+
+def test_parse_sitemap_returns_copies_and_limits_each_crawl():
+    parser = SitemapParser('https://example.com', max_urls=3)
+    session = FakeSession(sitemap_pages())
+    
+    async def run():
+        first = await parser.parse_sitemap(session, 'https://example.com/sitemap-1.xml')
+        first.clear()
+        again = await parser.parse_sitemap(session, 'https://example.com/sitemap-1.xml')
+        other = await parser.parse_sitemap(session, 'https://example.com/sitemap-2.xml')
+        return again, other
+    
+    again, other = asyncio.run(run())
+    assert again == {f'https://example.com/1/{i}' for i in range(3)}
+    assert other == {f'https://example.com/2/{i}' for i in range(3)}
@@ -0,0 +1,62 @@
+"""
+Tests for the technical SEO auditor.
+"""
+import json
+
+import pytest
+
+pytest.importorskip('extruct')
+
+from technical_audit import TechnicalAuditor
+
+
+def test_structured_data_flattens_json_ld_graph():
+    graph = {
+        '@context': 'https://schema.org',
+        '@graph': [
+            {'@type': 'WebSite', '@id': 'https://example.com/#website'},
+            {'@type': 'Organization', '@id': 'https://example.com/#organization'},
+            {'@type': 'WebPage', '@id': 'https://example.com/'},
+        ]
+    }
+    html = (
+        '<html><head><script type="application/ld+json">'
+        f'{json.dumps(graph)}'
+        '</script></head><body></body></html>'
+    )
+    
+    result = TechnicalAuditor('https://example.com').audit_structured_data(html)
+    
+    assert result['errors'] == []
+    assert sorted(result['schema_types']) == ['Organization', 'WebPage', 'WebSite']
+    assert result['schema_count'] == 3
+    assert result['status'] == 'good'
+
+
+def test_homepage_canonical_stays_critical():
+    html = '<html><head><link rel="canonical" href="https://example.com/"></head></html>'
+    
+    result = TechnicalAuditor('https://example.com').audit_canonical(html, 'https://example.com/blog/post')
+    
+    assert "Canonical points to homepage instead of current page" in result['issues']
+    assert any(issue.startswith("Canonical points to different URL") for issue in result['issues'])
+    assert result['severity'] == 'critical'
+
+
+def test_404_with_long_redirect_chain_stays_critical():
+    chain = ['https://example.com/a', 'https://example.com/b', 'https://example.com/c']
+    
+    result = TechnicalAuditor('https://example.com').audit_redirects(404, chain)
+    
+    assert "Redirect chain ends in 404" in result['issues']
+    assert "Redirect chain too long (3 hops)" in result['issues']
+    assert result['severity'] == 'critical'
+
+
+def test_noindex_conflict_stays_critical():
+    html = '<html><head><meta name="robots" content="noindex"></head></html>'
+    
+    result = TechnicalAuditor('https://example.com').audit_noindex(html, {'X-Robots-Tag': 'index, follow'})
+    
+    assert "Conflict between meta robots tag and X-Robots-Tag header" in result['issues']
+    assert result['severity'] == 'critical'
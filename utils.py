@@ -2,14 +2,67 @@
 Utility functions for URL normalization, domain extraction, and common helpers.
 """
 import re
-from urllib.parse import urljoin, urlparse, urlunparse
-from typing import Optional
+import sys
+from functools import lru_cache
+from urllib.parse import SplitResult, urljoin, urlsplit, urlunsplit
+from typing import Iterable, List, Optional
 import tldextract
 
+# Offline extractor using tldextract's bundled suffix list snapshot: the default extractor
+# tries to download the list (and write a disk cache) the first time each process uses it
+_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+# Well-formed http(s) URL: scheme, netloc, path, query, fragment. Anything urlsplit would
+# treat specially (tabs/newlines, IPv6 brackets, non-ASCII or empty host) falls through to it.
+# The host class is printable ASCII except # / ? [ ]
+_HTTP_URL_RE = re.compile(
+    r'(https?)://([\x21-\x22\x24-\x2e\x30-\x3e\x40-\x5a\x5c\x5e-\x7e]+)'
+    r'(/[^?#\t\r\n]*)?(?:\?([^#\t\r\n]*))?(?:#([^\t\r\n]*))?\Z'
+)
+
+
+@lru_cache(maxsize=16384)
+def _split_url(url: str) -> SplitResult:
+    """
+    urlsplit with a cache sized for a crawl (urllib's own holds only 128 entries, and the
+    helpers below see the same link URLs over and over). Plain http(s) URLs are split
+    with one regex match instead of urlsplit's Python-level parsing.
+    
+    Args:
+        url: URL to split
+        
+    Returns:
+        SplitResult, identical to urlsplit(url)
+    """
+    match = _HTTP_URL_RE.match(url)
+    if match:
+        scheme, netloc, path, query, fragment = match.groups()
+        return SplitResult(scheme, netloc, path or '', query or '', fragment or '')
+    return urlsplit(url)
+
+# http(s) URL whose host is plain lowercase ASCII labels (no userinfo, port or trailing dot);
+# captures the last two labels
+_SIMPLE_HOST_RE = re.compile(r'https?://(?:[a-z0-9-]+\.)*([a-z0-9-]+)\.([a-z]+)(?=[/?#]|$)')
+
+
+@lru_cache(maxsize=1)
+def _single_label_suffixes() -> frozenset:
+    """
+    Top-level suffixes with no multi-label public suffix beneath them (com, org, de, ...).
+    For hosts under these, the registered domain is simply the last two labels.
+    
+    Returns:
+        Frozenset of single-label suffixes
+    """
+    suffixes = _EXTRACT.tlds
+    nested = {suffix.rsplit('.', 1)[1] for suffix in suffixes if '.' in suffix}
+    return frozenset(suffix for suffix in suffixes if '.' not in suffix and suffix not in nested)
+
 
 def normalize_url(url: str, base_url: Optional[str] = None) -> str:
     """
     Normalize a URL by removing fragments, trailing slashes, and resolving relative URLs.
+    Only the scheme and host are lowercased; path and query are case-sensitive (RFC 3986).
     
     Args:
         url: URL to normalize
@@ -25,47 +78,72 @@ def normalize_url(url: str, base_url: Optional[str] = None) -> str:
     if base_url and not url.startswith(('http://', 'https://')):
         url = urljoin(base_url, url)
     
-    # Parse URL
-    parsed = urlparse(url)
+    # Parse URL (urlsplit keeps ;params in the path, so there is nothing to re-join)
+    parsed = _split_url(url)
     
-    # Remove fragment
-    normalized = urlunparse((
-        parsed.scheme,
-        parsed.netloc,
-        parsed.path,
-        parsed.params,
-        parsed.query,
-        ''  # Remove fragment
-    ))
+    # Rebuild without the fragment (urlsplit already lowercases the scheme)
+    netloc = parsed.netloc.lower()
+    if parsed.scheme and netloc:
+        normalized = f"{parsed.scheme}://{netloc}{parsed.path}"
+        if parsed.query:
+            normalized = f"{normalized}?{parsed.query}"
+    else:
+        # Relative and opaque (mailto:, tel:) URLs: let urllib reassemble them
+        normalized = urlunsplit(parsed._replace(netloc=netloc, fragment=''))
     
     # Remove trailing slash (except for root)
     if normalized.endswith('/') and len(parsed.path) > 1:
         normalized = normalized[:-1]
     
-    return normalized.lower()
+    return normalized
 
 
+def normalize_urls(urls: Iterable[str], base_url: Optional[str] = None) -> List[str]:
+    """
+    Normalize a batch of URLs (see normalize_url).
+    
+    Args:
+        urls: URLs to normalize
+        base_url: Base URL for resolving relative URLs
+        
+    Returns:
+        List of normalized URL strings, in input order
+    """
+    normalize = normalize_url
+    return [normalize(url, base_url) for url in urls]
+
+
+@lru_cache(maxsize=65536)
 def get_domain(url: str) -> str:
     """
     Extract the registered domain from a URL.
+    Memoized: crawls look up the same link URLs on page after page. The result is interned,
+    so every URL on a site shares one domain string and is_internal_link's == against the
+    (also interned) base domain is an identity check.
     
     Args:
         url: URL to extract domain from
         
     Returns:
-        Domain string (e.g., 'example.com')
+        Domain string (e.g., 'example.com'), or "" for an empty URL
     """
-    try:
-        extracted = tldextract.extract(url)
-        return f"{extracted.domain}.{extracted.suffix}"
-    except Exception:
-        parsed = urlparse(url)
-        return parsed.netloc
+    if not url:
+        return ""
+    
+    # Fast path: skip the suffix list walk for ordinary hosts like www.example.com
+    match = _SIMPLE_HOST_RE.match(url)
+    if match and match.group(2) in _single_label_suffixes():
+        return sys.intern(f"{match.group(1)}.{match.group(2)}")
+    
+    extracted = _EXTRACT(url)
+    return sys.intern(f"{extracted.domain}.{extracted.suffix}")
 
 
+@lru_cache(maxsize=131072)
 def is_internal_link(url: str, base_domain: str) -> bool:
     """
     Check if a URL is an internal link (same domain).
+    Memoized per (url, base_domain) pair.
     
     Args:
         url: URL to check
@@ -74,11 +152,10 @@ def is_internal_link(url: str, base_domain: str) -> bool:
     Returns:
         True if internal, False otherwise
     """
-    try:
-        url_domain = get_domain(url)
-        return url_domain == base_domain
-    except Exception:
+    if not url:
         return False
+    
+    return get_domain(url) == base_domain
 
 
 def clean_text(text: str) -> str:
@@ -94,9 +171,8 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    # Collapse whitespace runs (str.split() splits on the same characters as \s)
+    return ' '.join(text.split())
 
 
 def get_url_path(url: str) -> str:
@@ -109,10 +185,13 @@ def get_url_path(url: str) -> str:
     Returns:
         Path string
     """
+    if not url:
+        return ""
+    
     try:
-        parsed = urlparse(url)
-        return parsed.path
-    except Exception:
+        return _split_url(url).path
+    except ValueError:
+        # Malformed host, e.g. an unbalanced IPv6 bracket
         return ""
 
 